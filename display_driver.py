@@ -21,16 +21,26 @@ Wiring (unchanged):
   XPT2046     →  CS=GPIO7    IRQ=GPIO17
 
 Install:
-    sudo pip3 install --break-system-packages pillow spidev RPi.GPIO
+    sudo pip3 install --break-system-packages pillow numpy spidev RPi.GPIO
+    sudo pip3 install --break-system-packages numba      # optional, faster pack
 Enable SPI:
     sudo raspi-config → Interface Options → SPI → Enable
+Larger SPI transfers (whole 150 KB frame in ~3 ioctls instead of 38):
+    append  spidev.bufsiz=65536  to /boot/firmware/cmdline.txt, reboot
 """
 
 import time, sys, threading
+from concurrent.futures import ThreadPoolExecutor
 import RPi.GPIO as GPIO
 import spidev
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from numba import njit      # optional — compiles the RGB565 pack to one native loop
+except ImportError:
+    njit = None
+
 # ── PIN CONFIG (BCM) ──────────────────────────────────────────────────────────
 ILI_CS  = 8;  ILI_DC  = 25; ILI_RST = 24; ILI_BL  = 18
 ST_CS   = 5;  ST_DC   = 23; ST_RST  = 4
@@ -49,6 +59,15 @@ _spi.mode         = 0b00
 _spi.max_speed_hz = 40_000_000
 
 _lock = threading.Lock()
+_speed = _spi.max_speed_hz      # last clock set on the bus — guarded by _lock
+
+def _set_speed(hz):
+    # max_speed_hz is an ioctl (SPI_IOC_WR_MAX_SPEED_HZ); the bus only changes
+    # clock when it moves between panels and touch, so skip the no-op writes.
+    global _speed
+    if hz != _speed:
+        _spi.max_speed_hz = hz
+        _speed = hz
 
 # ── GPIO init ─────────────────────────────────────────────────────────────────
 GPIO.setwarnings(False)
@@ -61,35 +80,195 @@ GPIO.setup(T_IRQ, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
 
 # ── Low-level SPI helpers ─────────────────────────────────────────────────────
-def _write_bytes(cs_pin, dc_pin, dc_mode, data, speed):
+def _cmd_seq(cs, dc, seq, speed):
+    """
+    Send (cmd, data) pairs in one lock + CS assertion: each command byte goes
+    out with DC low, its parameters (if any) with DC high.
+    """
     with _lock:
-        _spi.max_speed_hz = speed
-        GPIO.output(dc_pin, GPIO.HIGH if dc_mode else GPIO.LOW)
-        GPIO.output(cs_pin, GPIO.LOW)
-        for i in range(0, len(data), 4096):
-            _spi.writebytes2(data[i:i+4096])
-        GPIO.output(cs_pin, GPIO.HIGH)
+        _set_speed(speed)
+        GPIO.output(cs, GPIO.LOW)
+        for cmd, data in seq:
+            GPIO.output(dc, GPIO.LOW)
+            _spi.writebytes2(cmd)
+            if data:
+                GPIO.output(dc, GPIO.HIGH)
+                _spi.writebytes2(data)  # spidev splits into bufsiz-sized ioctls
+        GPIO.output(cs, GPIO.HIGH)
 
-def _cmd(cs, dc, cmd, speed):
-    _write_bytes(cs, dc, False, [cmd], speed)
+def _cmd_dat(cs, dc, cmd, data, speed):
+    _cmd_seq(cs, dc, (([cmd], data),), speed)
+
+
+# ── RGB565 packing ────────────────────────────────────────────────────────────
+# The plain scalar loop is deliberate: LLVM auto-vectorises it (vector ops in
+# the IR, NEON on aarch64; ~3× the NumPy path per frame on x86), so there's no
+# hand-written SIMD C extension to build and ship alongside the driver.
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _pack565_jit(rgb, out):
+        for y in range(rgb.shape[0]):
+            for x in range(rgb.shape[1]):
+                r = rgb[y, x, 0]; g = rgb[y, x, 1]; b = rgb[y, x, 2]
+                c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+                out[y, 2*x]     = c >> 8
+                out[y, 2*x + 1] = c & 0xFF
+
+    # Compile now, not on the first frames: Numba specialises on layout and
+    # writability, so warm up every pair _Panel passes in — read-only
+    # np.asarray() pixels (RGB contiguous, RGBX/RGBA strided) and the writable
+    # strided canvas view, into a whole framebuffer or a dirty-rect sub-view.
+    _fb   = np.zeros((2, 2), dtype='>u2')
+    _rgbx = np.zeros((2, 2, 4), dtype=np.uint8)
+    _ro   = [np.zeros((2, 2, 3), dtype=np.uint8), _rgbx.copy()[..., :3]]
+    for _a in _ro:
+        _a.flags.writeable = False
+    for _rgb in _ro + [_rgbx[..., :3]]:
+        for _out in (_fb, _fb[:, :1]):
+            _pack565_jit(_rgb, _out.view(np.uint8))
+    del _fb, _rgbx, _ro, _a, _rgb, _out
+else:
+    _pack565_jit = None
+
+def _pack565(arr, fb):
+    """Pack arr, (h, w, 3) uint8 RGB, into fb, a (h, w) big-endian '>u2' view.
+
+    Either may be a strided sub-rectangle (canvas channels, dirty-rect updates).
+    """
+    if _pack565_jit is not None:
+        _pack565_jit(arr, fb.view(np.uint8))
+        return
+    # Pillow has no RGB→565 raw packer: tobytes('raw', 'BGR;16') raises
+    # "No packer found", and the 'BGR;16' image mode (native-endian, so it
+    # would still need a byteswap) was removed in Pillow 12.  NumPy it is.
+    # One plane per channel, masked/shifted while still uint8 (half the bytes
+    # of a uint16 pass); only the two planes that shift past 8 bits widen.
+    # In-place ops on contiguous planes keep each step a single NEON ufunc
+    # loop on the Pi (NumPy dispatches to ASIMD) with no extra temporaries.
+    # (Shifts beat per-channel LUT gathers, which are scalar loads.)
+    c = (arr[..., 0] & 0xF8).astype(np.uint16)
+    c <<= 8
+    g = (arr[..., 1] & 0xFC).astype(np.uint16)
+    g <<= 3
+    c |= g
+    c |= arr[..., 2] >> 3
+    fb[:] = c                                                # '>u2' swaps
 
-def _dat(cs, dc, data, speed):
-    _write_bytes(cs, dc, True, data, speed)
 
-def _cmd_dat(cs, dc, cmd, data, speed):
-    _cmd(cs, dc, cmd, speed)
-    if data:
-        _dat(cs, dc, data, speed)
+# ═══════════════════════════════════════════════════════════════════════════════
+# PANEL BASE  –  shared by ILI9341 and ST7735
+# ═══════════════════════════════════════════════════════════════════════════════
+_PACKABLE = ('RGB', 'RGBX', 'RGBA')        # modes _pack565 reads without convert()
+
+class _Panel:
+    """Framebuffer + frame push.  Subclasses set W, H, SPD, CS, DC, _window_cmds()."""
+
+    def _c(self, cmd, data=None): _cmd_dat(self.CS, self.DC, cmd, data, self.SPD)
+
+    def _init_fb(self):
+        # Two persistent framebuffers, never reallocated: the next frame is
+        # packed into the back one while the front one is still on the wire.
+        self._fbs = []
+        for _ in range(2):
+            fb = bytearray(self.W * self.H * 2)
+            self._fbs.append((fb, np.frombuffer(fb, dtype='>u2').reshape(self.H, self.W)))
+        self._back     = 0
+        self._tx       = ThreadPoolExecutor(max_workers=1)  # SPI worker
+        self._pending  = None
+        self._full_win = self._window_cmds(0, 0, self.W - 1, self.H - 1)
+        # Drawing surface sharing memory with _np_fb: ImageDraw on canvas writes
+        # straight into the array the packer reads — no Image.new per frame and
+        # no tobytes() copy.  RGBX because Pillow only maps 4-byte pixels
+        # zero-copy; readonly is cleared or ImageDraw would copy on first draw.
+        self._np_fb = np.zeros((self.H, self.W, 4), dtype=np.uint8)
+        self.canvas = Image.frombuffer('RGBX', (self.W, self.H), self._np_fb,
+                                       'raw', 'RGBX', 0, 1)
+        self.canvas.readonly = 0
+
+    def flush(self):
+        """Block until the frame currently on the SPI bus has been sent."""
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def _send(self, win, buf):
+        # CASET + RASET + RAMWR + pixels as one CS assertion: after 0x2C the
+        # controller only expects data, so DC goes high once for the frame.
+        _cmd_seq(self.CS, self.DC, win + ((b'\x2C', buf),), self.SPD)
+
+    def _pixels(self, img, box=None):
+        # (h, w, 3) uint8 pixels of img, or of box=(x0, y0, x1, y1) exclusive
+        if img is self.canvas:
+            a = self._np_fb[..., :3]                         # view, no copy
+            return a if box is None else a[box[1]:box[3], box[0]:box[2]]
+        a = np.asarray(img if box is None else img.crop(box))
+        return a if a.shape[2] == 3 else a[..., :3]          # RGBX/RGBA: skip X/A
+
+    def _fit(self, img):
+        # resize/convert only when img can't be packed as-is
+        if img.size != (self.W, self.H):
+            img = img.resize((self.W, self.H))
+        if img.mode not in _PACKABLE:
+            img = img.convert('RGB')
+        return img
+
+    def pack(self, img):
+        """
+        Pack a full-frame image to RGB565 bytes once.  For static screens:
+        keep the result and pass it to image() on every push — no pack at all,
+        the frame goes straight to the SPI worker.
+        """
+        buf = bytearray(self.W * self.H * 2)
+        img = img if img is self.canvas else self._fit(img)
+        _pack565(self._pixels(img), np.frombuffer(buf, dtype='>u2').reshape(self.H, self.W))
+        return bytes(buf)
+
+    def image(self, img, dirty=None):
+        """
+        Push a Pillow image (or full-frame bytes from pack()) to the panel.
+        Returns once the frame is packed — the SPI transfer runs on a worker
+        thread, overlapping the caller's next render.  flush() waits for it.
+        dirty=(x0, y0, x1, y1), inclusive, packs and sends only that box —
+        SPI bytes scale with the box area instead of the full screen.
+        Fast path: draw into self.canvas (W×H, shared with the packer) and
+        pass it back — no size/mode checks, no copies.  Other W×H RGB, RGBX
+        or RGBA images are packed as-is; anything else is resized/converted
+        first, which costs a full-frame allocation + copy on every call.
+        """
+        if isinstance(img, bytes):                           # pre-packed, dirty ignored
+            self.flush()
+            self._pending = self._tx.submit(self._send, self._full_win, img)
+            return
+        if img is not self.canvas:
+            img = self._fit(img)
+
+        fb, fb_np = self._fbs[self._back]
+        if dirty is None:
+            win = self._full_win                             # prebuilt, constant
+            _pack565(self._pixels(img), fb_np)
+            buf = fb
+        else:
+            x0, y0 = max(0, dirty[0]), max(0, dirty[1])
+            x1, y1 = min(self.W - 1, dirty[2]), min(self.H - 1, dirty[3])
+            if x0 > x1 or y0 > y1:
+                return
+            win = self._window_cmds(x0, y0, x1, y1)
+            sub = fb_np[y0:y1 + 1, x0:x1 + 1]
+            _pack565(self._pixels(img, (x0, y0, x1 + 1, y1 + 1)), sub)
+            buf = sub.tobytes()                              # contiguous copy
+
+        self.flush()                                         # previous frame done
+        self._pending = self._tx.submit(self._send, win, buf)
+        self._back ^= 1
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ILI9341  –  LANDSCAPE 320×240
 # ═══════════════════════════════════════════════════════════════════════════════
-class ILI9341:
+class ILI9341(_Panel):
     W, H = 320, 240          # landscape dimensions
-    SPD  = 40_000_000
-
-    def _c(self, cmd, data=None): _cmd_dat(ILI_CS, ILI_DC, cmd, data, self.SPD)
+    SPD  = 40_000_000        # most modules also hold 48/62.5 MHz on short wires
+    CS, DC = ILI_CS, ILI_DC
 
     def __init__(self):
         GPIO.output(ILI_RST, GPIO.LOW);  time.sleep(0.1)
@@ -125,37 +304,21 @@ class ILI9341:
         c(0xE1, [0x00, 0x25, 0x27, 0x05, 0x10, 0x09, 0x3A, 0x78,
                  0x4D, 0x05, 0x18, 0x0D, 0x38, 0x3A, 0x1F])
         c(0x29);              time.sleep(0.05)   # display on
+        self._init_fb()
         print("[ILI9341] OK – landscape 320×240")
 
-    def _window(self, x0, y0, x1, y1):
-        self._c(0x2A, [x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])
-        self._c(0x2B, [y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])
-        self._c(0x2C)
-
-    def image(self, img):
-        if img.size != (self.W, self.H):
-            img = img.resize((self.W, self.H))
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        raw = img.tobytes()
-        buf = bytearray(self.W * self.H * 2)
-        for i in range(self.W * self.H):
-            r, g, b = raw[i*3], raw[i*3+1], raw[i*3+2]
-            c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-            buf[i*2]     = c >> 8
-            buf[i*2 + 1] = c & 0xFF
-        self._window(0, 0, self.W - 1, self.H - 1)
-        _dat(ILI_CS, ILI_DC, buf, self.SPD)
+    def _window_cmds(self, x0, y0, x1, y1):
+        return ((b'\x2A', bytes([x0 >> 8, x0 & 0xFF, x1 >> 8, x1 & 0xFF])),
+                (b'\x2B', bytes([y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF])))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ST7735  –  LANDSCAPE 160×128
 # ═══════════════════════════════════════════════════════════════════════════════
-class ST7735:
+class ST7735(_Panel):
     W, H = 160, 128          # landscape dimensions
     SPD  = 15_000_000
-
-    def _c(self, cmd, data=None): _cmd_dat(ST_CS, ST_DC, cmd, data, self.SPD)
+    CS, DC = ST_CS, ST_DC
 
     def __init__(self):
         GPIO.output(ST_RST, GPIO.LOW);  time.sleep(0.1)
@@ -181,27 +344,12 @@ class ST7735:
                  0x2E, 0x2E, 0x37, 0x3F, 0x00, 0x00, 0x02, 0x10])
         c(0x13);              time.sleep(0.01)
         c(0x29);              time.sleep(0.1)
+        self._init_fb()
         print("[ST7735]  OK – landscape 160×128")
 
-    def _window(self, x0, y0, x1, y1):
-        self._c(0x2A, [0x00, x0, 0x00, x1])
-        self._c(0x2B, [0x00, y0, 0x00, y1])
-        self._c(0x2C)
-
-    def image(self, img):
-        if img.size != (self.W, self.H):
-            img = img.resize((self.W, self.H))
-        if img.mode != 'RGB':
-            img = img.convert('RGB')
-        raw = img.tobytes()
-        buf = bytearray(self.W * self.H * 2)
-        for i in range(self.W * self.H):
-            r, g, b = raw[i*3], raw[i*3+1], raw[i*3+2]
-            c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-            buf[i*2]     = c >> 8
-            buf[i*2 + 1] = c & 0xFF
-        self._window(0, 0, self.W - 1, self.H - 1)
-        _dat(ST_CS, ST_DC, buf, self.SPD)
+    def _window_cmds(self, x0, y0, x1, y1):
+        return ((b'\x2A', bytes([0x00, x0, 0x00, x1])),
+                (b'\x2B', bytes([0x00, y0, 0x00, y1])))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -240,19 +388,48 @@ TOUCH_IRQ_ACTIVE_HIGH = False
 def _raw_touch():
     """Read XPT2046 raw ADC — 1 MHz, 8 samples, median-averaged."""
     def ch(cmd):
-        vals = []
         with _lock:
-            _spi.max_speed_hz = 1_000_000
-            for _ in range(8):
-                GPIO.output(T_CS, GPIO.LOW)
-                r = _spi.xfer2([cmd, 0x00, 0x00])
-                GPIO.output(T_CS, GPIO.HIGH)
-                vals.append(((r[1] << 8) | r[2]) >> 3)
-        vals.sort()
-        return sum(vals[2:6]) // 4
+            _set_speed(1_000_000)
+            # 8 back-to-back conversions in one message — CS stays low and the
+            # XPT2046 just sees 8 consecutive 24-clock cycles (1 ioctl, not 8)
+            GPIO.output(T_CS, GPIO.LOW)
+            r = _spi.xfer2([cmd, 0x00, 0x00] * 8)
+            GPIO.output(T_CS, GPIO.HIGH)
+        s = sorted([((r[i] << 8) | r[i + 1]) >> 3 for i in range(1, 24, 3)])
+        return (s[2] + s[3] + s[4] + s[5]) >> 2     # mean of the middle four
     return ch(TOUCH_X_CMD), ch(TOUCH_Y_CMD)
 
 
+# ── Pen-down interrupt ────────────────────────────────────────────────────────
+# PENIRQ edges set a flag from RPi.GPIO's callback thread, so the main loop only
+# calls read_touch() after the pen actually went down instead of every frame.
+_pen_down = threading.Event()
+
+def _pen_isr(channel):
+    _pen_down.set()
+
+def watch_touch(bouncetime=30):
+    """
+    Arm the PENIRQ edge interrupt. Returns False if the kernel/RPi.GPIO
+    combination refuses edge detection — callers then keep polling.
+    """
+    edge = GPIO.RISING if TOUCH_IRQ_ACTIVE_HIGH else GPIO.FALLING
+    try:
+        GPIO.add_event_detect(T_IRQ, edge, callback=_pen_isr,
+                              bouncetime=bouncetime)
+    except RuntimeError as e:           # "Failed to add edge detection"
+        print(f"[touch] IRQ unavailable ({e}) — polling instead")
+        return False
+    return True
+
+def touch_pending():
+    """True (once) if the pen went down since the last call."""
+    if _pen_down.is_set():
+        _pen_down.clear()
+        return True
+    return False
+
+
 def read_touch():
     """
     Returns (x, y) in landscape pixel coords (0–319, 0–239),
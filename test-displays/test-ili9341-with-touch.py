@@ -7,7 +7,7 @@ Compatible with adafruit-circuitpython-rgb-display (modern API)
 Install:
     sudo pip3 install --break-system-packages \
         adafruit-circuitpython-rgb-display \
-        pillow spidev RPi.GPIO
+        pillow numpy spidev RPi.GPIO
 
 Enable SPI first:
     sudo raspi-config  →  Interface Options  →  SPI  →  Enable
@@ -15,6 +15,7 @@ Enable SPI first:
 
 import time
 import sys
+import functools
 
 # ── Graceful import checks ────────────────────────────────────────────────────
 def require(pkg, install):
@@ -30,9 +31,11 @@ require("busio",                       "adafruit-blinka")
 require("digitalio",                   "adafruit-blinka")
 require("adafruit_rgb_display.ili9341","adafruit-circuitpython-rgb-display")
 require("PIL",                         "pillow")
+require("numpy",                       "numpy")
 
 import board, busio, digitalio
 import adafruit_rgb_display.ili9341 as ili9341
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 
@@ -187,10 +190,34 @@ def read_touch(tspi, GPIO):
 def canvas():
     return Image.new("RGB", (SCREEN_W, SCREEN_H), 0)
 
-def push(disp, img):
-    disp.image(img)
+def push(disp, img, box=None):
+    """Push the whole frame, or only box=(x0, y0, x1, y1) (exclusive) of it."""
+    if box is None:
+        disp.image(img)
+    else:
+        # image() rotates the crop by ROTATION but takes x/y in panel
+        # coordinates, so place the box where the rotated frame puts it
+        x, y = _panel_xy(box, img.size)
+        disp.image(img.crop(box), x=x, y=y)
+
+def _panel_xy(box, size):
+    """Top-left of box once a (w, h) frame is rotated ROTATION° CCW (Pillow)."""
+    x0, y0, x1, y1 = box
+    w, h = size
+    if ROTATION == 90:
+        return y0, w - x1
+    if ROTATION == 180:
+        return w - x1, h - y1
+    if ROTATION == 270:
+        return h - y1, x0
+    return x0, y0
 
 def fnt(size=14, bold=False):
+    # normalised so fnt(10, True) and fnt(10, bold=True) share one cache entry
+    return _font(size, bool(bold))
+
+@functools.lru_cache(maxsize=32)          # truetype() re-reads + parses the TTF each call
+def _font(size, bold):
     name = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
     try:
         return ImageFont.truetype(
@@ -220,16 +247,11 @@ def test_color_fill(disp):
 # ── TEST 2 – RGB gradient ─────────────────────────────────────────────────────
 def test_gradient(disp):
     print("\n[TEST 2] RGB gradient")
-    img = canvas()
-    px  = img.load()
-    for y in range(SCREEN_H):
-        for x in range(SCREEN_W):
-            px[x, y] = (
-                int(x / SCREEN_W  * 255),
-                int(y / SCREEN_H  * 255),
-                128,
-            )
-    push(disp, img)
+    arr = np.empty((SCREEN_H, SCREEN_W, 3), dtype=np.uint8)
+    arr[..., 0] = (np.arange(SCREEN_W) / SCREEN_W * 255).astype(np.uint8)[None, :]
+    arr[..., 1] = (np.arange(SCREEN_H) / SCREEN_H * 255).astype(np.uint8)[:, None]
+    arr[..., 2] = 128
+    push(disp, Image.fromarray(arr, "RGB"))
     time.sleep(2)
     print("[TEST 2] PASSED")
 
@@ -271,14 +293,23 @@ def test_scroll(disp):
 
     strip = Image.new("RGB", (tw + SCREEN_W, 40), (0, 0, 60))
     ImageDraw.Draw(strip).text((SCREEN_W, 4), msg, font=f, fill=(0, 220, 255))
+    strip_arr = np.asarray(strip)
+    sw        = strip_arr.shape[1]
+
+    # One persistent frame: the Image shares memory with frame_arr, so each
+    # step only rewrites the 40-px band — no per-frame Image.new/crop/paste.
+    frame_arr = np.empty((SCREEN_H, SCREEN_W, 4), dtype=np.uint8)
+    frame_arr[:] = (0, 0, 30, 255)
+    frame = Image.frombuffer("RGBA", (SCREEN_W, SCREEN_H), frame_arr, "raw", "RGBA", 0, 1)
+    band  = frame_arr[SCREEN_H // 2 - 20:SCREEN_H // 2 + 20, :, :3]
 
     end, offset = time.time() + 5, 0
     while time.time() < end:
-        frame = Image.new("RGB", (SCREEN_W, SCREEN_H), (0, 0, 30))
-        frame.paste(strip.crop((offset, 0, offset + SCREEN_W, 40)),
-                    (0, SCREEN_H // 2 - 20))
+        n = min(SCREEN_W, sw - offset)          # tail of the strip, then wrap to its head
+        band[:, :n] = strip_arr[:, offset:offset + n]
+        band[:, n:] = strip_arr[:, :SCREEN_W - n]
         push(disp, frame)
-        offset = (offset + 4) % (tw + SCREEN_W)
+        offset = (offset + 4) % sw
         time.sleep(0.03)
     print("[TEST 4] PASSED")
 
@@ -297,6 +328,7 @@ def test_touch_draw(disp, tspi, GPIO):
               font=fnt(14), fill=(255, 255, 100))
     push(disp, img)
 
+    pen_down = GPIO.RISING if TOUCH_IRQ_ACTIVE_HIGH else GPIO.FALLING
     end, prev, touches = time.time() + 15, None, 0
     while time.time() < end:
         pt = read_touch(tspi, GPIO)
@@ -307,12 +339,17 @@ def test_touch_draw(disp, tspi, GPIO):
                 draw.line([prev, (x, y)], fill=col, width=3)
             else:
                 draw.ellipse([x-3, y-3, x+3, y+3], fill=col)
-            push(disp, img)
+            # Only the stroke's bounding box changed — send just that over SPI
+            px, py = prev or (x, y)
+            push(disp, img, (max(0, min(px, x) - 3),        max(0, min(py, y) - 3),
+                             min(SCREEN_W, max(px, x) + 4), min(SCREEN_H, max(py, y) + 4)))
             prev = (x, y)
             touches += 1
+            time.sleep(0.02)            # pen down: ~50 samples/s, as before
         else:
             prev = None
-        time.sleep(0.02)
+            # Pen up — sleep in the kernel until T_IRQ fires instead of polling
+            GPIO.wait_for_edge(TOUCH_IRQ_BCM, pen_down, timeout=50)
     print(f"[TEST 5] PASSED – {touches} touch sample(s) detected")
 
 
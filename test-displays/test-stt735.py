@@ -19,17 +19,34 @@ Tests:
 Run:
     python3 test_st7735.py
     python3 test_st7735.py --quick     # skips slow tests (scroll, gradient)
+    python3 test_st7735.py --hw-cs     # SPI controller drives CS (see below)
+
+Fewer SPI ioctls per frame (optional): append  spidev.bufsiz=65536  to
+/boot/firmware/cmdline.txt and reboot — a whole 40 KB frame goes in one.
+
+Hardware CS (--hw-cs): GPIO5 isn't a CE pin, so remap CE0 onto it — put
+    dtoverlay=spi0-1cs,cs0_pin=5
+in /boot/firmware/config.txt and reboot.  The controller then asserts CS as
+part of each transfer and the two GPIO writes around every frame go away.
 """
 
 import sys
 import time
 import threading
+import functools
 import RPi.GPIO as GPIO
 import spidev
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from numba import njit      # optional — compiles the RGB565 pack to one native loop
+except ImportError:
+    njit = None
+
 # ── Args ──────────────────────────────────────────────────────────────────────
 QUICK = "--quick" in sys.argv
+HW_CS = "--hw-cs" in sys.argv
 
 # ── Pin config (BCM) ──────────────────────────────────────────────────────────
 ST_CS  = 5
@@ -42,7 +59,7 @@ W, H = 160, 128
 # ── SPI — standalone instance (not shared with ILI9341 during this test) ─────
 _spi = spidev.SpiDev()
 _spi.open(0, 0)
-_spi.no_cs        = True
+_spi.no_cs        = not HW_CS       # --hw-cs: kernel asserts CE0 (= GPIO5)
 _spi.mode         = 0b00
 _spi.max_speed_hz = 15_000_000
 
@@ -51,7 +68,7 @@ _lock = threading.Lock()
 # ── GPIO ──────────────────────────────────────────────────────────────────────
 GPIO.setwarnings(False)
 GPIO.setmode(GPIO.BCM)
-for pin in [ST_CS, ST_DC, ST_RST]:
+for pin in [ST_DC, ST_RST] + ([] if HW_CS else [ST_CS]):   # overlay owns CS pin
     GPIO.setup(pin, GPIO.OUT, initial=GPIO.HIGH)
 
 
@@ -59,44 +76,57 @@ for pin in [ST_CS, ST_DC, ST_RST]:
 # LOW-LEVEL SPI
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def _write(dc_mode, data):
-    with _lock:
-        GPIO.output(ST_DC, GPIO.HIGH if dc_mode else GPIO.LOW)
-        GPIO.output(ST_CS, GPIO.LOW)
-        for i in range(0, len(data), 4096):
-            _spi.writebytes2(data[i:i + 4096])
-        GPIO.output(ST_CS, GPIO.HIGH)
-
-def _cmd(cmd, data=None):
-    _write(False, [cmd])
-    if data:
-        _write(True, data)
+def _cs(level):
+    if not HW_CS:                   # --hw-cs: the controller drives it
+        GPIO.output(ST_CS, level)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # ST7735 INIT  (landscape 160×128, MADCTL 0x68)
 # ═══════════════════════════════════════════════════════════════════════════════
 
+# (cmd, params, delay after) — replayed by init_display() under one lock
+INIT_SEQ = (
+    (0x01, None, 0.15),                          # SW reset
+    (0x11, None, 0.5),                           # sleep out
+    (0xB1, [0x01, 0x2C, 0x2D], 0),               # frame rate normal
+    (0xB4, [0x07], 0),                           # display inversion off
+    (0xC0, [0xA2, 0x02, 0x84], 0),               # power control 1
+    (0xC1, [0xC5], 0),                           # power control 2
+    (0xC2, [0x0A, 0x00], 0),                     # power control 3
+    (0xC5, [0x8A, 0x2A], 0),                     # VCOM control
+    (0x3A, [0x05], 0),                           # pixel format RGB565
+    (0x36, [0x68], 0),                           # MADCTL: MV+MX+BGR → landscape
+    (0xE0, [0x02, 0x1C, 0x07, 0x12, 0x37, 0x32, 0x29, 0x2D,
+            0x29, 0x25, 0x2B, 0x39, 0x00, 0x01, 0x03, 0x10], 0),
+    (0xE1, [0x03, 0x1D, 0x07, 0x06, 0x2E, 0x2C, 0x29, 0x2D,
+            0x2E, 0x2E, 0x37, 0x3F, 0x00, 0x00, 0x02, 0x10], 0),
+    (0x13, None, 0.01),                          # normal display on
+    (0x29, None, 0.1),                           # display on
+)
+
 def init_display():
     GPIO.output(ST_RST, GPIO.LOW);  time.sleep(0.1)
     GPIO.output(ST_RST, GPIO.HIGH); time.sleep(0.15)
 
-    _cmd(0x01);              time.sleep(0.15)   # SW reset
-    _cmd(0x11);              time.sleep(0.5)    # sleep out
-    _cmd(0xB1, [0x01, 0x2C, 0x2D])             # frame rate normal
-    _cmd(0xB4, [0x07])                          # display inversion off
-    _cmd(0xC0, [0xA2, 0x02, 0x84])             # power control 1
-    _cmd(0xC1, [0xC5])                          # power control 2
-    _cmd(0xC2, [0x0A, 0x00])                    # power control 3
-    _cmd(0xC5, [0x8A, 0x2A])                    # VCOM control
-    _cmd(0x3A, [0x05])                          # pixel format RGB565
-    _cmd(0x36, [0x68])                          # MADCTL: MV+MX+BGR → landscape
-    _cmd(0xE0, [0x02, 0x1C, 0x07, 0x12, 0x37, 0x32, 0x29, 0x2D,
-                0x29, 0x25, 0x2B, 0x39, 0x00, 0x01, 0x03, 0x10])
-    _cmd(0xE1, [0x03, 0x1D, 0x07, 0x06, 0x2E, 0x2C, 0x29, 0x2D,
-                0x2E, 0x2E, 0x37, 0x3F, 0x00, 0x00, 0x02, 0x10])
-    _cmd(0x13);              time.sleep(0.01)   # normal display on
-    _cmd(0x29);              time.sleep(0.1)    # display on
+    # One lock for the whole sequence; commands between delays share one CS
+    # assertion.  CS is released across each delay so the panel sees a fresh
+    # transaction after reset / sleep-out.
+    with _lock:
+        held = False                            # CS currently asserted
+        for cmd, data, delay in INIT_SEQ:
+            if not held:
+                _cs(GPIO.LOW); held = True
+            GPIO.output(ST_DC, GPIO.LOW)
+            _spi.writebytes2([cmd])
+            if data:
+                GPIO.output(ST_DC, GPIO.HIGH)
+                _spi.writebytes2(data)
+            if delay:
+                _cs(GPIO.HIGH); held = False
+                time.sleep(delay)
+        if held:
+            _cs(GPIO.HIGH)
     print("[ST7735] init OK  –  landscape 160×128")
 
 
@@ -104,26 +134,85 @@ def init_display():
 # FRAME PUSH
 # ═══════════════════════════════════════════════════════════════════════════════
 
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _pack565_jit(rgb, out):
+        for y in range(rgb.shape[0]):
+            for x in range(rgb.shape[1]):
+                r = rgb[y, x, 0]; g = rgb[y, x, 1]; b = rgb[y, x, 2]
+                c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
+                out[y, 2*x]     = c >> 8
+                out[y, 2*x + 1] = c & 0xFF
+
+    # Compile now, not on the first frame: np.asarray(img) is read-only, and
+    # Numba specialises on that, so warm up with a read-only array too.
+    _w = np.zeros((1, 1, 3), dtype=np.uint8); _w.flags.writeable = False
+    _pack565_jit(_w, np.empty((1, 2), dtype=np.uint8))
+else:
+    _pack565_jit = None
+
+def _pack565(img, out=None):
+    """(h, w) big-endian RGB565 array of an RGB image, any size — written
+    into `out` (a matching '>u2' array) when given."""
+    arr = np.asarray(img)                                   # (H, W, 3) uint8
+    if out is None:
+        out = np.empty(arr.shape[:2], dtype='>u2')
+    if _pack565_jit is not None:
+        _pack565_jit(arr, out.view(np.uint8))
+        return out
+    # RGB565 in a handful of whole-frame NumPy ops instead of 20,480 Python
+    # iterations; astype('>u2') emits the MSB-first byte order the panel wants.
+    # (No Pillow C path to use instead: convert('BGR;16') raises "wrong mode",
+    # tobytes('raw', 'BGR;16'/'RGB;16') has no packer, and the BGR;16 mode
+    # was dropped in Pillow 12 — same finding as display_driver._pack565.)
+    c = (arr[..., 0] & 0xF8).astype(np.uint16)
+    c <<= 8
+    c |= (arr[..., 1] & 0xFC).astype(np.uint16) << 3
+    c |= arr[..., 2] >> 3
+    out[...] = c                        # byte-swapping store, no astype() copy
+    return out
+
+# Full-screen window preamble, built once: (DC level, bytes) segments for
+# CASET, RASET, RAMWR — constant, so no per-frame list building.
+_WINDOW = (
+    (GPIO.LOW,  b'\x2A'), (GPIO.HIGH, bytes([0x00, 0x00, 0x00, W - 1])),
+    (GPIO.LOW,  b'\x2B'), (GPIO.HIGH, bytes([0x00, 0x00, 0x00, H - 1])),
+    (GPIO.LOW,  b'\x2C'),
+)
+
+def _push_window():
+    # caller holds _lock with CS asserted (or HW_CS)
+    for dc, seg in _WINDOW:
+        GPIO.output(ST_DC, dc)
+        _spi.writebytes2(seg)
+
+def _push(buf):
+    """Send one full frame of already-packed RGB565 bytes."""
+    with _lock:
+        _cs(GPIO.LOW)                   # window + pixels in one CS assertion
+        _push_window()
+        GPIO.output(ST_DC, GPIO.HIGH)
+        _spi.writebytes2(buf)           # whole buffer: spidev splits it into bufsiz ioctls
+        _cs(GPIO.HIGH)
+
 def show(img):
     """Convert a Pillow RGB image to RGB565 and push to the display."""
-    if img.size != (W, H):
-        img = img.resize((W, H))
-    if img.mode != 'RGB':
-        img = img.convert('RGB')
-
-    # Set window — full screen
-    _cmd(0x2A, [0x00, 0x00, 0x00, W - 1])
-    _cmd(0x2B, [0x00, 0x00, 0x00, H - 1])
-    _cmd(0x2C)
-
-    raw = img.tobytes()
-    buf = bytearray(W * H * 2)
-    for i in range(W * H):
-        r, g, b = raw[i * 3], raw[i * 3 + 1], raw[i * 3 + 2]
-        c = ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-        buf[i * 2]     = c >> 8
-        buf[i * 2 + 1] = c & 0xFF
-    _write(True, buf)
+    # Every test (and ui.render_st_status) draws a native 160×128 RGB frame;
+    # the assert flags a renderer that leaks another mode/size (stripped
+    # under -O, where the fallback below still copes).
+    assert img.mode == 'RGB' and img.size == (W, H), (img.mode, img.size)
+    if img.mode != 'RGB' or img.size != (W, H):
+        img = img.convert('RGB').resize((W, H))
+    _pack565(img, _OUT_565)
+    _push(_OUT)
+
+# show()'s frame buffer: packed in place each call and handed to spidev as-is
+# (writebytes2 takes any buffer object and returns once it's on the wire, so
+# the next show() can't overwrite bytes still being sent).
+_OUT     = bytearray(W * H * 2)
+_OUT_565 = np.frombuffer(_OUT, dtype='>u2').reshape(H, W)
+
+BG = (8, 9, 14)                     # shared test background
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -134,6 +223,11 @@ def canvas(bg=(0, 0, 0)):
     return Image.new("RGB", (W, H), bg)
 
 def fnt(size=11, bold=False):
+    # normalised so fnt(10, True) and fnt(10, bold=True) share one cache entry
+    return _font(size, bool(bold))
+
+@functools.lru_cache(maxsize=32)          # truetype() re-reads + parses the TTF each call
+def _font(size, bold):
     name = "DejaVuSans-Bold.ttf" if bold else "DejaVuSans.ttf"
     try:
         return ImageFont.truetype(
@@ -188,16 +282,11 @@ def test_colour_fills():
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def test_gradient():
-    img = canvas()
-    px  = img.load()
-    for y in range(H):
-        for x in range(W):
-            px[x, y] = (
-                int(x / W * 255),
-                int(y / H * 255),
-                128,
-            )
-    show(img)
+    arr = np.empty((H, W, 3), dtype=np.uint8)
+    arr[..., 0] = (np.arange(W) / W * 255).astype(np.uint8)[None, :]
+    arr[..., 1] = (np.arange(H) / H * 255).astype(np.uint8)[:, None]
+    arr[..., 2] = 128
+    show(Image.fromarray(arr, "RGB"))
     pause(2.0, 1.0)
 
 
@@ -206,7 +295,7 @@ def test_gradient():
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def test_shapes():
-    img  = canvas((8, 9, 14))
+    img  = canvas(BG)
     draw = ImageDraw.Draw(img)
 
     # Filled rectangles
@@ -238,7 +327,7 @@ def test_shapes():
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def test_text():
-    img  = canvas((8, 9, 14))
+    img  = canvas(BG)
     draw = ImageDraw.Draw(img)
 
     draw.text(( 4,  4), "Size 8 regular",  font=fnt(8),       fill=(150, 155, 165))
@@ -263,7 +352,7 @@ def test_boundary():
     with a 4×4 coloured square. If any corner is cut off, the display
     window or offset is misconfigured.
     """
-    img  = canvas((8, 9, 14))
+    img  = canvas(BG)
     draw = ImageDraw.Draw(img)
 
     # Full perimeter
@@ -300,14 +389,12 @@ def test_checkerboard():
     8×8 pixel checkerboard — reveals sub-pixel bleed, row offset errors,
     or RGB565 colour channel bleed.
     """
-    img = canvas()
-    px  = img.load()
     A   = (0, 210, 240)    # cyan
     B   = (14, 16, 22)     # near-black
     SZ  = 8
-    for y in range(H):
-        for x in range(W):
-            px[x, y] = A if ((x // SZ + y // SZ) % 2 == 0) else B
+    yy, xx = np.indices((H, W))
+    pal = np.array([A, B], dtype=np.uint8)
+    img = Image.fromarray(pal[(xx // SZ + yy // SZ) & 1], "RGB")
 
     draw = ImageDraw.Draw(img)
     draw.text((4, 4), "pixel check", font=fnt(9, True), fill=(255, 255, 255))
@@ -328,22 +415,28 @@ def test_scroll():
     msg_w = bb[2] - bb[0]
 
     strip_w = msg_w + W
-    strip   = Image.new("RGB", (strip_w, 20), (8, 9, 14))
+    strip   = Image.new("RGB", (strip_w, 20), BG)
     ImageDraw.Draw(strip).text((W, 2), msg, font=f, fill=(0, 210, 240))
 
+    # Static background + label
+    frame = canvas(BG)
+    ImageDraw.Draw(frame).text((4, 4), "scroll test", font=fnt(9), fill=(85, 95, 115))
+
+    # Strip and frame are packed to RGB565 once; each step just copies the
+    # visible window of the packed strip into the packed frame's band rows —
+    # no PIL work and no re-encode inside the animation loop.
+    strip565 = _pack565(strip)
+    buf      = bytearray(_pack565(frame).tobytes())
+    band     = np.frombuffer(buf, dtype='>u2').reshape(H, W)[H // 2 - 10:H // 2 + 10]
+
     end    = time.time() + (4 if QUICK else 7)
     offset = 0
-    bg     = (8, 9, 14)
 
     while time.time() < end:
-        frame = canvas(bg)
-        frame.paste(strip.crop((offset, 0, offset + W, 20)), (0, H // 2 - 10))
-
-        # Static label
-        draw = ImageDraw.Draw(frame)
-        draw.text((4, 4), "scroll test", font=fnt(9), fill=(85, 95, 115))
-
-        show(frame)
+        n = min(W, strip_w - offset)            # tail of the strip, then wrap to its head
+        band[:, :n] = strip565[:, offset:offset + n]
+        band[:, n:] = strip565[:, :W - n]
+        _push(buf)
         offset = (offset + 3) % strip_w
         time.sleep(0.03)
 
@@ -391,7 +484,7 @@ def test_orientation():
     Expected:  TOP label at physical top, LEFT label at physical left.
     If wrong → adjust MADCTL byte in display_driver.py / init_display().
     """
-    img  = canvas((8, 9, 14))
+    img  = canvas(BG)
     draw = ImageDraw.Draw(img)
 
     BF = fnt(10, bold=True)
@@ -433,7 +526,7 @@ def test_orientation():
 # ═══════════════════════════════════════════════════════════════════════════════
 
 def show_summary():
-    img  = canvas((8, 9, 14))
+    img  = canvas(BG)
     draw = ImageDraw.Draw(img)
 
     passed = sum(1 for _, s in results if s == PASS)
@@ -9,19 +9,23 @@ Run:
     python3 main.py
 
 Dependencies (already in display_driver.py):
-    sudo pip3 install --break-system-packages pillow spidev RPi.GPIO
+    sudo pip3 install --break-system-packages pillow numpy spidev RPi.GPIO
 """
 
 import time
 import threading
+import queue
 import sys
+import traceback
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
 # ── Import the spidev driver ──────────────────────────────────────────────────
 # display_driver.py must be in the same directory.
 try:
     from display_driver import (
         ILI9341, ST7735,
-        read_touch,
+        read_touch, watch_touch, touch_pending,
         ILI_BL,
         GPIO,
     )
@@ -77,7 +81,7 @@ class AppState:
 
         self.focus_session_mins = 25
         self.focus_elapsed_mins = 0
-        self.focus_active       = False
+        self._focus_active      = False       # see the focus_active property
         self.focus_app          = ""
         self.focus_message      = ""
 
@@ -88,6 +92,20 @@ class AppState:
         self.time_str = _time.strftime("%H:%M")
         self.date_str = _time.strftime("%a, %d %b %Y")
 
+    # Setting focus_active (the preview, or any code that fills AppState)
+    # arms the minute tick; clearing it, e.g. via end_focus(), cancels it.
+    @property
+    def focus_active(self):
+        return self._focus_active
+
+    @focus_active.setter
+    def focus_active(self, on):
+        was, self._focus_active = self._focus_active, bool(on)
+        if on and not was:
+            _arm_focus()
+        elif was and not on:
+            _disarm_focus()
+
 
 state = AppState()
 
@@ -96,73 +114,99 @@ state = AppState()
 # RENDER HELPERS
 # ════════════════════════════════════════════════════════════════════════════════
 
-def build_ili_frame():
-    """Return the correct Image for the current screen."""
+def ili_frame_data():
+    """The dict the current screen's renderer reads — same data, same frame."""
     s = state.screen
 
     if s == SCREEN_DASHBOARD:
-        return render_dashboard({
+        return {
             "time_str":   state.time_str,
             "date_str":   state.date_str,
             "username":   state.username,
             "activities": state.activities,
-        })
+        }
 
     if s == SCREEN_APPS:
-        img, rects = render_apps({})
-        state.apps_rects = rects
-        return img
+        return {}
 
     if s == SCREEN_BRIEF:
-        return render_brief({
+        return {
             "time_str":  state.time_str,
             "date_str":  state.date_str,
             "weather":   state.weather,
             "events":    state.events,
             "reminders": state.reminders,
-        })
+        }
 
     if s == SCREEN_EMAILS:
-        return render_emails({
+        return {
             "time_str":    state.time_str,
             "summary":     state.email_summary,
             "emails":      state.emails,
             "unread_count":state.unread,
-        })
+        }
 
     if s == SCREEN_SYSMON:
-        return render_sysmon({
+        return {
             "time_str":   state.time_str,
             "deck":       state.deck_stats   or None,
             "server":     state.server_stats or None,
             "temp_files": state.temp_info,
             "clean_done": state.clean_done,
-        })
+        }
 
     if s == SCREEN_FOCUS:
-        return render_focus({
+        return {
             "time_str":     state.time_str,
             "session_mins": state.focus_session_mins,
             "elapsed_mins": state.focus_elapsed_mins,
             "app_name":     state.focus_app,
             "active":       state.focus_active,
             "message":      state.focus_message,
-        })
+        }
 
-    return render_dashboard({
+    return {
         "time_str": state.time_str,
         "username": state.username,
-    })
+    }
+
+
+_RENDERERS = {
+    SCREEN_DASHBOARD: render_dashboard,
+    SCREEN_BRIEF:     render_brief,
+    SCREEN_EMAILS:    render_emails,
+    SCREEN_SYSMON:    render_sysmon,
+    SCREEN_FOCUS:     render_focus,
+}
+
+def build_ili_frame(data=None, img=None, screen=None):
+    """
+    Return the correct Image for the current screen (or screen + its data).
+    img: a reused canvas to draw into instead of allocating a new one.
+    """
+    s = state.screen if screen is None else screen
+    if data is None:
+        data = ili_frame_data()
+
+    if s == SCREEN_APPS:
+        img, rects = render_apps(data, img)
+        state.apps_rects = rects
+        return img
+
+    return _RENDERERS.get(s, render_dashboard)(data, img)
 
 
-def build_st_frame():
-    return render_st_status({
+def st_frame_data():
+    return {
         "deck":          state.deck_stats   or {},
         "server":        state.server_stats or {},
         "weather":       state.weather,
         "deck_online":   state.deck_online,
         "server_online": state.server_online,
-    })
+    }
+
+def build_st_frame(data=None, img=None):
+    return render_st_status(st_frame_data() if data is None else data, img)
 
 
 # ════════════════════════════════════════════════════════════════════════════════
@@ -170,6 +214,7 @@ def build_st_frame():
 # ════════════════════════════════════════════════════════════════════════════════
 
 DEBOUNCE_MS = 300   # ignore touches within 300ms of last one
+DEBOUNCE_NS = DEBOUNCE_MS * 1_000_000
 
 def handle_touch(x, y):
     """Route a validated touch coordinate to a screen transition or action."""
@@ -199,9 +244,8 @@ def handle_touch(x, y):
         if back:
             # Focus mode: end session on back
             if s == SCREEN_FOCUS and state.focus_active:
-                state.focus_active       = False
+                end_focus("Session ended.")
                 state.focus_elapsed_mins = 0
-                state.focus_message      = "Session ended."
             # Sysmon: reset clean flag
             if s == SCREEN_SYSMON:
                 state.clean_done = False
@@ -217,22 +261,85 @@ def handle_touch(x, y):
 
 
 # ════════════════════════════════════════════════════════════════════════════════
-# FOCUS TIMER TICK
+# FOCUS TIMER
 # ════════════════════════════════════════════════════════════════════════════════
 
-_focus_last_tick = 0.0
-
-def tick_focus():
-    global _focus_last_tick
-    if not state.focus_active:
+# Event-driven: a Timer fires once per real minute while a session runs,
+# instead of the main loop polling the clock 10× a second.
+_focus_timer = None
+
+def _arm_focus():
+    global _focus_timer
+    _focus_timer = threading.Timer(60.0, _focus_tick)
+    _focus_timer.daemon = True
+    _focus_timer.start()
+
+def _disarm_focus():
+    global _focus_timer
+    if _focus_timer is not None:
+        _focus_timer.cancel()
+        _focus_timer = None
+
+def _focus_tick():
+    # A tick superseded by a newer session, or racing end_focus(), is dropped
+    if threading.current_thread() is not _focus_timer or not state.focus_active:
         return
-    now = _time.time()
-    if now - _focus_last_tick >= 60.0:   # tick every real minute
-        _focus_last_tick = now
-        state.focus_elapsed_mins += 1
-        if state.focus_elapsed_mins >= state.focus_session_mins:
-            state.focus_active  = False
-            state.focus_message = "Session complete!"
+    state.focus_elapsed_mins += 1
+    if state.focus_elapsed_mins >= state.focus_session_mins:
+        end_focus("Session complete!")
+    else:
+        _arm_focus()
+
+def end_focus(message):
+    state.focus_active  = False          # cancels the tick
+    state.focus_message = message
+
+
+# ════════════════════════════════════════════════════════════════════════════════
+# DISPLAY PUSH WORKERS
+# ════════════════════════════════════════════════════════════════════════════════
+
+class Pusher:
+    """
+    Feeds one panel from a background thread through a 1-deep queue, so the
+    main loop renders frame N+1 while frame N is packed and sent.
+    Latest wins: a frame the worker hasn't picked up yet is replaced.
+    A frame is an Image, pack() bytes, or a zero-arg render job run on the
+    worker — jobs draw into panel.canvas, which only this thread touches.
+    A frame that fails to render or send is logged and dropped; the worker
+    keeps serving the queue so the next frame still reaches the panel.
+    """
+    def __init__(self, panel):
+        self.panel = panel
+        self.q     = queue.Queue(maxsize=1)
+        self.t     = threading.Thread(target=self._run, daemon=True)
+        self.t.start()
+
+    def _run(self):
+        while True:
+            frame = self.q.get()
+            if frame is None:
+                break
+            try:
+                if callable(frame):
+                    frame = frame()
+                self.panel.image(frame)   # driver _lock still serialises the bus
+            except Exception:
+                print(f"[push] {type(self.panel).__name__} frame failed:",
+                      file=sys.stderr)
+                traceback.print_exc()
+
+    def push(self, frame):
+        try:
+            self.q.get_nowait()       # drop the stale, unsent frame
+        except queue.Empty:
+            pass
+        self.q.put_nowait(frame)      # single producer — can't be full here
+
+    def close(self):
+        self.push(None)
+        self.t.join()
+        self.panel.flush()
 
 
 # ════════════════════════════════════════════════════════════════════════════════
@@ -241,17 +348,22 @@ def tick_focus():
 
 ILI_REFRESH_HZ = 10   # ILI9341 target frame rate
 ST_REFRESH_S   = 5    # ST7735 refreshes every N seconds (stats don't change fast)
+STATIC_SCREENS = {SCREEN_APPS}   # no live data — packed to RGB565 once, then replayed
 
 def main():
     state.tick_time()
 
     if HARDWARE:
         # ── Init displays ─────────────────────────────────────────────────────
-        print("[main] Initialising ILI9341...")
-        disp = ILI9341()
-
-        print("[main] Initialising ST7735...")
-        st = ST7735()
+        # Both inits are mostly reset/sleep-out delays (~0.5 s ILI9341,
+        # ~1 s ST7735). Each command takes the bus lock on its own and the
+        # sleeps run outside it, so constructing the panels side by side
+        # overlaps those waits; result() re-raises a failed init here.
+        print("[main] Initialising ILI9341 + ST7735...")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            ili_init = pool.submit(ILI9341)
+            st_init  = pool.submit(ST7735)
+            disp, st = ili_init.result(), st_init.result()
 
         # Backlight on
         GPIO.setup(ILI_BL, GPIO.OUT)
@@ -260,9 +372,16 @@ def main():
         print("[main] Backlight ON.")
         print("[main] Running. Tap the disk chart to open apps.\n")
 
+        ili_out = Pusher(disp)
+        st_out  = Pusher(st)
+        touch_irq = watch_touch()       # False → fall back to polling PENIRQ
+
         last_st_update = 0.0
-        last_touch_ms  = 0.0
+        last_touch_ns  = 0
         frame_interval = 1.0 / ILI_REFRESH_HZ
+        packed         = {}     # static screen → RGB565 bytes
+        last_ili_key   = None   # (screen, repr(data)) of the frame on the panel
+        last_st_key    = None
 
         try:
             while True:
@@ -270,27 +389,46 @@ def main():
 
                 # ── Time update ───────────────────────────────────────────────
                 state.tick_time()
-                tick_focus()
 
-                # ── Touch read ────────────────────────────────────────────────
-                pt = read_touch()
+                # ── Touch read (SPI only after a pen-down edge) ───────────────
+                pt = read_touch() if not touch_irq or touch_pending() else None
                 if pt:
-                    now_ms = _time.time() * 1000
-                    if now_ms - last_touch_ms > DEBOUNCE_MS:
-                        last_touch_ms = now_ms
+                    now_ns = _time.monotonic_ns()   # int, immune to clock jumps
+                    if now_ns - last_touch_ns > DEBOUNCE_NS:
+                        last_touch_ns = now_ns
                         x, y = pt
                         changed = handle_touch(x, y)
                         if changed:
                             print(f"[touch] ({x},{y}) → {state.screen}")
-
-                # ── ILI9341 frame ─────────────────────────────────────────────
-                disp.image(build_ili_frame())
-
-                # ── ST7735 frame (slow refresh) ───────────────────────────────
+                            last_ili_key = None     # force one redraw
+
+                # ── ILI9341 frame (only when its inputs changed) ──────────────
+                # This key is the render cache: the render_* functions are pure
+                # in their data dict, so an unchanged key skips the render and
+                # the SPI push alike (memoising inside ui.py would only add a
+                # frame copy, since renders draw into the panel's one canvas).
+                # repr() rather than id(): a list in state mutated in place keeps its id
+                s    = state.screen
+                data = ili_frame_data()
+                key  = (s, repr(data))
+                if key != last_ili_key:
+                    last_ili_key = key
+                    if s in STATIC_SCREENS:
+                        if s not in packed:
+                            packed[s] = disp.pack(build_ili_frame(data))
+                        ili_out.push(packed[s])
+                    else:               # drawn into the panel's zero-copy canvas
+                        ili_out.push(partial(build_ili_frame, data, disp.canvas, s))
+
+                # ── ST7735 frame (slow refresh, skipped if unchanged) ─────────
                 now = _time.time()
                 if now - last_st_update >= ST_REFRESH_S:
-                    st.image(build_st_frame())
                     last_st_update = now
+                    data = st_frame_data()
+                    key  = repr(data)
+                    if key != last_st_key:
+                        last_st_key = key
+                        st_out.push(partial(build_st_frame, data, st.canvas))
 
                 # ── Frame rate cap ────────────────────────────────────────────
                 elapsed = _time.time() - loop_start
@@ -301,6 +439,8 @@ def main():
         except KeyboardInterrupt:
             print("\n[main] Stopped.")
         finally:
+            ili_out.close()
+            st_out.close()
             bl.stop()
             from display_driver import _spi
             _spi.close()
@@ -6,7 +6,7 @@ ILI9341 320×240 landscape  |  ST7735 160×128 landscape
 Dark theme, neon accents, clean layout. No decorative noise.
 """
 
-import math, time
+import math, time, functools
 from PIL import Image, ImageDraw, ImageFont
 
 # ── Dimensions ────────────────────────────────────────────────────────────────
@@ -37,7 +37,7 @@ SCREEN_SYSMON    = "sysmon"
 SCREEN_FOCUS     = "focus"
 
 # ── Fonts ─────────────────────────────────────────────────────────────────────
-_fc = {}
+_fc: dict = {}
 def fnt(size=13, bold=False):
     k = (size, bold)
     if k not in _fc:
@@ -49,17 +49,53 @@ def fnt(size=13, bold=False):
             _fc[k] = ImageFont.load_default()
     return _fc[k]
 
+# ── Text metrics ──────────────────────────────────────────────────────────────
+# Labels, clocks and values repeat frame after frame, so each (text, font) is
+# shaped by FreeType once; fonts live forever in _fc, so keying on the object
+# is safe. draw is kept in tw/th's signature but no longer needed.
+_scratch = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+@functools.lru_cache(maxsize=512)
+def _measure(text, font):
+    bb = _scratch.textbbox((0, 0), text, font=font)
+    return bb[2] - bb[0], bb[3] - bb[1]
+
 def tw(draw, text, font):
-    bb = draw.textbbox((0, 0), text, font=font)
-    return bb[2] - bb[0]
+    return _measure(text, font)[0]
 
 def th(draw, text, font):
-    bb = draw.textbbox((0, 0), text, font=font)
-    return bb[3] - bb[1]
+    # Ink height of this string, not font.getmetrics(): "12:34" is 8 px and
+    # "activity" 11 px in the same font, and the bars centre on that.
+    return _measure(text, font)[1]
 
+# Both canvases stay RGB: Pillow draws text into "P" images without anti-aliasing.
 def ili_canvas(): return Image.new("RGB", (ILI_W, ILI_H), BG)
 def st_canvas():  return Image.new("RGB", (ST_W,  ST_H),  BG)
 
+# ── Static bases ──────────────────────────────────────────────────────────────
+# Chrome that is identical every frame (bars, dividers, fixed labels, the pie)
+# is drawn once per screen by a _*_base() builder; a frame then starts as a
+# copy of that base and only draws its live data on top. Pass img to paste
+# the base into a caller-owned canvas (the main loop reuses each panel's
+# driver canvas) instead of allocating a new image. Bases are kept per
+# canvas mode so pasting into a reused RGBX canvas stays a straight copy.
+_bases: dict = {}
+
+def from_base(build, img=None, *args):
+    """build(*args)'s cached base as a new image, or pasted into img if given."""
+    mode = "RGB" if img is None else img.mode
+    key  = (build, args, mode)
+    base = _bases.get(key)
+    if base is None:
+        base = build(*args)
+        if base.mode != mode:
+            base = base.convert(mode)
+        _bases[key] = base
+    if img is None:
+        return base.copy()
+    img.paste(base)
+    return img
+
 
 # ════════════════════════════════════════════════════════════════════════════════
 # PRIMITIVES
@@ -72,6 +108,7 @@ def vline(draw, x, y0, y1, color=LINE):
     draw.line([(x, y0), (x, y1)], fill=color, width=1)
 
 def dot(draw, cx, cy, r=3, color=GREEN):
+    # plain ellipse — cheaper than pasting a sprite; static dots live in bases
     draw.ellipse([cx-r, cy-r, cx+r, cy+r], fill=color)
 
 def status_dot(draw, cx, cy, online=True):
@@ -93,6 +130,10 @@ def draw_pie(draw, cx, cy, r):
 
 def progress_bar(draw, x, y, w, h, frac, color):
     draw.rectangle([x, y, x+w, y+h], fill=SURFACE)
+    progress_fill(draw, x, y, w, h, frac, color)
+
+def progress_fill(draw, x, y, w, h, frac, color):
+    """The filled part only — the SURFACE trough comes from a cached base."""
     fill = max(0, min(w, int(w * frac)))
     if fill:
         draw.rectangle([x, y, x+fill, y+h], fill=color)
@@ -104,6 +145,17 @@ def _safe(d, *keys, default="--"):
             return d[k]
     return default
 
+_KEY_ALIASES = {"mem": "ram", "used": "disk_used", "total": "disk_total"}
+
+def _norm(d):
+    """Fold a stats dict's spellings into lower-case canonical keys, once per
+    frame, so the renderers do plain .get()s.  Same precedence as _safe:
+    exact key, then upper-case spelling, then alias."""
+    n = {_KEY_ALIASES[k]: v for k, v in d.items() if k in _KEY_ALIASES}
+    n.update({k.lower(): v for k, v in d.items() if not k.islower() and k not in _KEY_ALIASES})
+    n.update({k: v for k, v in d.items() if k.islower() and k not in _KEY_ALIASES})
+    return n
+
 
 # ════════════════════════════════════════════════════════════════════════════════
 # CHROME
@@ -114,96 +166,123 @@ BOT_H = 18
 
 def top_bar(draw, left_text, right_text="", accent=CYAN):
     draw.rectangle([0, 0, ILI_W, BAR_H], fill=SURFACE)
-    draw.text((10, (BAR_H - th(draw, left_text, fnt(11, True))) // 2),
-              left_text, font=fnt(11, bold=True), fill=accent)
+    top_bar_text(draw, left_text, right_text, accent)
+    hline(draw, 0, ILI_W, BAR_H, LINE)
+
+def top_bar_text(draw, left_text="", right_text="", accent=CYAN):
+    """Just the bar's labels — for live text over a base that has the bar."""
+    f = fnt(11, bold=True)
+    if left_text:
+        draw.text((10, (BAR_H - th(draw, left_text, f)) // 2),
+                  left_text, font=f, fill=accent)
     if right_text:
-        rtw = tw(draw, right_text, fnt(11, bold=True))
+        rtw = tw(draw, right_text, f)
         draw.text((ILI_W - rtw - 10,
-                   (BAR_H - th(draw, right_text, fnt(11, True))) // 2),
-                  right_text, font=fnt(11, bold=True), fill=accent)
-    hline(draw, 0, ILI_W, BAR_H, LINE)
+                   (BAR_H - th(draw, right_text, f)) // 2),
+                  right_text, font=f, fill=accent)
 
 def bottom_hint(draw, text, color=MUTED):
     """Bottom bar — back text sits bottom-left as a tap target."""
+    hline(draw, 0, ILI_W, ILI_H - BOT_H, LINE)
+    bottom_hint_text(draw, text, color)
+
+def bottom_hint_text(draw, text, color=MUTED):
+    f = fnt(9)
     y = ILI_H - BOT_H
-    hline(draw, 0, ILI_W, y, LINE)
-    draw.text((10, y + (BOT_H - th(draw, text, fnt(9))) // 2),
-              text, font=fnt(9), fill=color)
+    draw.text((10, y + (BOT_H - th(draw, text, f)) // 2),
+              text, font=f, fill=color)
 
 
 # ════════════════════════════════════════════════════════════════════════════════
 # DASHBOARD
 # ════════════════════════════════════════════════════════════════════════════════
 
-def render_dashboard(data: dict) -> Image.Image:
+COL_W  = 110                                # pie column | activity feed
+PIE_CX = COL_W // 2
+PIE_CY = BAR_H + (ILI_H - BAR_H - BOT_H) // 2
+PIE_R  = 38
+FEED_X = COL_W + 12                         # activity rows: text column
+ROW_H  = (ILI_H - BAR_H - BOT_H) // 4
+
+# Shown when no activities are supplied; their time column is the live clock.
+DEFAULT_ACTIVITIES = (
+    {"title": "Reminder",    "subtitle": "Meeting in 15 min",
+     "color": ORANGE,        "online": True},
+    {"title": "Inbox",       "subtitle": "3 new messages",
+     "color": BLUE,          "online": True},
+    {"title": "System",      "subtitle": "All services online",
+     "color": CYAN,          "online": True},
+    {"title": "Focus ready", "subtitle": "VS Code queued",
+     "color": GREEN,         "online": True},
+)
+
+def _dashboard_base(rows):
     img  = ili_canvas()
     draw = ImageDraw.Draw(img)
+    f9   = fnt(9)
+
+    top_bar(draw, "activity")
+
+    draw_pie(draw, PIE_CX, PIE_CY, PIE_R)
+    draw.ellipse([PIE_CX-PIE_R-1, PIE_CY-PIE_R-1,
+                  PIE_CX+PIE_R+1, PIE_CY+PIE_R+1],
+                 outline=LINE, width=1)
 
+    lbl = "disk"
+    lw  = tw(draw, lbl, f9)
+    draw.text((PIE_CX - lw // 2, PIE_CY + PIE_R + 5),
+              lbl, font=f9, fill=MUTED)
+
+    vline(draw, COL_W, BAR_H + 8, ILI_H - BOT_H - 8, LINE)
+
+    # Row backdrops: SURFACE stripe on even rows, divider under all but the last
+    for i in range(rows):
+        ry = BAR_H + i * ROW_H
+        if i % 2 == 0:
+            draw.rectangle([FEED_X - 4, ry, ILI_W, ry + ROW_H - 1], fill=SURFACE)
+        if i < 3:
+            hline(draw, FEED_X, ILI_W, ry + ROW_H - 1, LINE)
+
+    hline(draw, 0, ILI_W, ILI_H - BOT_H, LINE)
+    return img
+
+def render_dashboard(data: dict, img=None) -> Image.Image:
     time_str   = data.get("time_str",   "00:00")
     date_str   = data.get("date_str",   "")
     username   = data.get("username",   "user")
     activities = data.get("activities", [])
 
-    top_bar(draw, "activity", time_str)
+    FX = FEED_X
+    FW = ILI_W - FX - 10
 
-    COL_W  = 110
-    pie_cx = COL_W // 2
-    pie_cy = BAR_H + (ILI_H - BAR_H - BOT_H) // 2
-    pie_r  = 38
-
-    draw_pie(draw, pie_cx, pie_cy, pie_r)
-    draw.ellipse([pie_cx-pie_r-1, pie_cy-pie_r-1,
-                  pie_cx+pie_r+1, pie_cy+pie_r+1],
-                 outline=LINE, width=1)
+    items = (activities if activities else DEFAULT_ACTIVITIES)[:4]
 
-    lbl = "disk"
-    lw  = tw(draw, lbl, fnt(9))
-    draw.text((pie_cx - lw // 2, pie_cy + pie_r + 5),
-              lbl, font=fnt(9), fill=MUTED)
-
-    vline(draw, COL_W, BAR_H + 8, ILI_H - BOT_H - 8, LINE)
+    img  = from_base(_dashboard_base, img, len(items))
+    draw = ImageDraw.Draw(img)
+    f9, f11b = fnt(9), fnt(11, True)
 
-    FX    = COL_W + 12
-    FW    = ILI_W - FX - 10
-    ROW_H = (ILI_H - BAR_H - BOT_H) // 4
-
-    default_activities = [
-        {"title": "Reminder",    "subtitle": "Meeting in 15 min",
-         "time": time_str,       "color": ORANGE, "online": True},
-        {"title": "Inbox",       "subtitle": "3 new messages",
-         "time": time_str,       "color": BLUE,   "online": True},
-        {"title": "System",      "subtitle": "All services online",
-         "time": time_str,       "color": CYAN,   "online": True},
-        {"title": "Focus ready", "subtitle": "VS Code queued",
-         "time": time_str,       "color": GREEN,  "online": True},
-    ]
-    items = activities if activities else default_activities
+    top_bar_text(draw, right_text=time_str)
 
-    for i, item in enumerate(items[:4]):
+    for i, item in enumerate(items):
         ry    = BAR_H + i * ROW_H
         color = item.get("color", CYAN)
 
-        if i % 2 == 0:
-            draw.rectangle([FX - 4, ry, ILI_W, ry + ROW_H - 1], fill=SURFACE)
-
+        # accent bar — a plain rectangle beats pasting a prebuilt block here
         draw.rectangle([FX - 4, ry + 6, FX - 2, ry + ROW_H - 7], fill=color)
 
         ty = ry + ROW_H // 2 - 11
         draw.text((FX, ty),      item.get("title", ""),
-                  font=fnt(11, bold=True), fill=WHITE)
+                  font=f11b, fill=WHITE)
         draw.text((FX, ty + 14), item.get("subtitle", ""),
-                  font=fnt(9), fill=MUTED)
+                  font=f9, fill=MUTED)
 
-        t_str = item.get("time", "")
-        t_w   = tw(draw, t_str, fnt(9))
-        draw.text((ILI_W - t_w - 14, ty + 14), t_str, font=fnt(9), fill=MUTED)
+        t_str = item.get("time", "") if activities else time_str
+        t_w   = tw(draw, t_str, f9)
+        draw.text((ILI_W - t_w - 14, ty + 14), t_str, font=f9, fill=MUTED)
         status_dot(draw, ILI_W - 7, ry + ROW_H // 2,
                    online=item.get("online", True))
 
-        if i < 3:
-            hline(draw, FX, ILI_W, ry + ROW_H - 1, LINE)
-
-    bottom_hint(draw, username)
+    bottom_hint_text(draw, username)
     return img
 
 
@@ -218,59 +297,87 @@ APPS_TILES = [
     {"id": SCREEN_SYSMON, "label": "system\ncare",      "color": GREEN},
 ]
 
-def render_apps(data: dict) -> tuple:
+# ── Fixed tile geometry, worked out once at import ────────────────────────────
+APPS_PAD    = 6
+APPS_TILE_W = (ILI_W - APPS_PAD * 3) // 2
+APPS_TILE_H = (ILI_H - BAR_H - APPS_PAD * 3) // 2
+
+def _apps_layout():
+    for i, tile in enumerate(APPS_TILES):
+        tx = APPS_PAD + (i % 2) * (APPS_TILE_W + APPS_PAD)
+        ty = BAR_H + APPS_PAD + (i // 2) * (APPS_TILE_H + APPS_PAD)
+        yield tx, ty, tx + APPS_TILE_W, ty + APPS_TILE_H, tile
+
+_APPS_LAYOUT = tuple(_apps_layout())                    # (tx, ty, tx2, ty2, tile)
+_APPS_HIT    = tuple((tx, ty, tx2, ty2, tile["id"])
+                     for tx, ty, tx2, ty2, tile in _APPS_LAYOUT)
+
+def _apps_base():
     img  = ili_canvas()
     draw = ImageDraw.Draw(img)
+    lf   = fnt(22, bold=True)
+    lh   = 26
 
     top_bar(draw, "apps")
 
-    PAD    = 6
-    tile_w = (ILI_W - PAD * 3) // 2
-    tile_h = (ILI_H - BAR_H - PAD * 3) // 2
-    hit_rects = []
-
-    for i, tile in enumerate(APPS_TILES):
-        col = i % 2
-        row = i // 2
-        tx  = PAD + col * (tile_w + PAD)
-        ty  = BAR_H + PAD + row * (tile_h + PAD)
-        tx2 = tx + tile_w
-        ty2 = ty + tile_h
+    for tx, ty, tx2, ty2, tile in _APPS_LAYOUT:
         color = tile["color"]
 
         draw.rectangle([tx, ty, tx2, ty2], fill=SURFACE)
 
         lines = tile["label"].split("\n")
-        lf    = fnt(22, bold=True)
-        lh    = 26
-        total = len(lines) * lh
-        ly    = ty + (tile_h - total) // 2 - 4
+        ly    = ty + (APPS_TILE_H - len(lines) * lh) // 2 - 4
 
         for line in lines:
             lw = tw(draw, line, lf)
-            draw.text((tx + (tile_w - lw) // 2, ly), line, font=lf, fill=color)
+            draw.text((tx + (APPS_TILE_W - lw) // 2, ly), line, font=lf, fill=color)
             ly += lh
 
         draw.rectangle([tx + 20, ty2 - 5, tx2 - 20, ty2 - 3], fill=color)
 
-        hit_rects.append((tx, ty, tx2, ty2, tile["id"]))
-
-    mid_x = PAD + tile_w + PAD // 2
-    mid_y = BAR_H + PAD + tile_h + PAD // 2
+    mid_x = APPS_PAD + APPS_TILE_W + APPS_PAD // 2
+    mid_y = BAR_H + APPS_PAD + APPS_TILE_H + APPS_PAD // 2
     vline(draw, mid_x, BAR_H, ILI_H - BOT_H, LINE)
     hline(draw, 0, ILI_W, mid_y, LINE)
 
     bottom_hint(draw, "← back")
-    return img, hit_rects
+    return img
+
+def render_apps(data: dict, img=None) -> tuple:
+    """The grid is entirely static: a copy of its base plus the fixed hit rects."""
+    return from_base(_apps_base, img), _APPS_HIT
 
 
 # ════════════════════════════════════════════════════════════════════════════════
 # BRIEF MY DAY
 # ════════════════════════════════════════════════════════════════════════════════
 
-def render_brief(data: dict) -> Image.Image:
+BRIEF_LX = 14
+
+TAG_COLORS = {"work": BLUE, "break": GREEN, "personal": ORANGE, "focus": MAGENTA}
+DEFAULT_EVENTS = (
+    {"time": "09:00", "title": "Morning standup", "tag": "work"},
+    {"time": "11:30", "title": "Code review",      "tag": "work"},
+    {"time": "14:00", "title": "Lunch",            "tag": "break"},
+    {"time": "16:00", "title": "Team sync",        "tag": "work"},
+)
+DEFAULT_REMINDERS = ("Check weekly report", "Reply to design team")
+
+def _brief_base(has_date, n_events):
+    """Top bar and the three section dividers; only the date line and the
+    number of schedule rows move them."""
     img  = ili_canvas()
     draw = ImageDraw.Draw(img)
+    top_bar(draw, "brief my day", accent=CYAN)
+
+    y = BAR_H + 10 + (16 if has_date else 0)
+    for y in (y, y + 50, y + 50 + 23 + 16 * n_events):
+        hline(draw, BRIEF_LX, ILI_W - BRIEF_LX, y, LINE)
+    return img
+
+def render_brief(data: dict, img=None) -> Image.Image:
+    f9,   f9b,  f10 = fnt(9),        fnt(9, True),  fnt(10)
+    f10b, f18b, f24 = fnt(10, True), fnt(18, True), fnt(24)
 
     time_str  = data.get("time_str",  "00:00")
     date_str  = data.get("date_str",  "")
@@ -278,56 +385,48 @@ def render_brief(data: dict) -> Image.Image:
     events    = data.get("events",    [])
     reminders = data.get("reminders", [])
 
-    top_bar(draw, "brief my day", time_str, CYAN)
+    events = (events or DEFAULT_EVENTS)[:4]
+
+    img  = from_base(_brief_base, img, bool(date_str), len(events))
+    draw = ImageDraw.Draw(img)
+
+    top_bar_text(draw, right_text=time_str, accent=CYAN)
 
     y  = BAR_H + 10
-    LX = 14
+    LX = BRIEF_LX
 
     if date_str:
-        draw.text((LX, y), date_str, font=fnt(10), fill=MUTED)
+        draw.text((LX, y), date_str, font=f10, fill=MUTED)
         y += 16
 
-    hline(draw, LX, ILI_W - LX, y, LINE)
-    y += 10
+    y += 10                            # divider is in the base
 
     icon = weather.get("icon", "—")
     temp = weather.get("temp", "—")
     desc = weather.get("desc", "")
-    draw.text((LX,      y),      icon, font=fnt(24),           fill=WHITE)
-    draw.text((LX + 34, y + 2),  temp, font=fnt(18, bold=True), fill=CYAN)
-    draw.text((LX + 34, y + 22), desc, font=fnt(9),             fill=MUTED)
-    y += 40
+    draw.text((LX,      y),      icon, font=f24,  fill=WHITE)
+    draw.text((LX + 34, y + 2),  temp, font=f18b, fill=CYAN)
+    draw.text((LX + 34, y + 22), desc, font=f9,   fill=MUTED)
+    y += 40 + 10
 
-    hline(draw, LX, ILI_W - LX, y, LINE)
-    y += 10
-
-    draw.text((LX, y), "schedule", font=fnt(9, bold=True), fill=MUTED)
+    draw.text((LX, y), "schedule", font=f9b, fill=MUTED)
     y += 13
 
-    tag_colors = {"work": BLUE, "break": GREEN, "personal": ORANGE, "focus": MAGENTA}
-    default_events = [
-        {"time": "09:00", "title": "Morning standup", "tag": "work"},
-        {"time": "11:30", "title": "Code review",      "tag": "work"},
-        {"time": "14:00", "title": "Lunch",            "tag": "break"},
-        {"time": "16:00", "title": "Team sync",        "tag": "work"},
-    ]
-    for ev in (events or default_events)[:4]:
-        tc = tag_colors.get(ev.get("tag", "work"), CYAN)
+    for ev in events:
+        tc = TAG_COLORS.get(ev.get("tag", "work"), CYAN)
         draw.rectangle([LX, y + 2, LX + 2, y + 12], fill=tc)
-        draw.text((LX + 6,  y), ev.get("time",  ""), font=fnt(10, bold=True), fill=MUTED)
-        draw.text((LX + 46, y), ev.get("title", ""), font=fnt(10),            fill=WHITE)
+        draw.text((LX + 6,  y), ev.get("time",  ""), font=f10b, fill=MUTED)
+        draw.text((LX + 46, y), ev.get("title", ""), font=f10,  fill=WHITE)
         y += 16
 
-    hline(draw, LX, ILI_W - LX, y, LINE)
     y += 10
 
-    draw.text((LX, y), "reminders", font=fnt(9, bold=True), fill=MUTED)
+    draw.text((LX, y), "reminders", font=f9b, fill=MUTED)
     y += 13
 
-    default_reminders = ["Check weekly report", "Reply to design team"]
-    for rem in (reminders or default_reminders)[:3]:
+    for rem in (reminders or DEFAULT_REMINDERS)[:3]:
         dot(draw, LX + 3, y + 5, r=2, color=ORANGE)
-        draw.text((LX + 10, y), rem, font=fnt(10), fill=WHITE)
+        draw.text((LX + 10, y), rem, font=f10, fill=WHITE)
         y += 14
 
     bottom_hint(draw, "← back")
@@ -338,60 +437,94 @@ def render_brief(data: dict) -> Image.Image:
 # SUMMARIZE EMAILS
 # ════════════════════════════════════════════════════════════════════════════════
 
-def render_emails(data: dict) -> Image.Image:
+EMAIL_LX = 14
+
+DEFAULT_EMAILS = (
+    {"from": "boss@work.com",  "subject": "Q4 review",    "time": "08:14"},
+    {"from": "noreply@gh.com", "subject": "PR merged",    "time": "09:02"},
+    {"from": "team@corp.com",  "subject": "Daily digest", "time": "09:30"},
+    {"from": "alerts@sys.io",  "subject": "Disk warning", "time": "10:01"},
+)
+
+def _emails_base(n_lines, n_mails):
+    """Bar, section labels, divider and row stripes for a given summary
+    length and message count — both small, so few variants ever exist."""
     img  = ili_canvas()
     draw = ImageDraw.Draw(img)
+    f9b  = fnt(9, True)
+    LX   = EMAIL_LX
+
+    top_bar(draw, "")                  # title carries the live unread count
+
+    y = BAR_H + 10
+    draw.text((LX, y), "summary", font=f9b, fill=MUTED)
+    y += 13 + 13 * n_lines
+
+    hline(draw, LX, ILI_W - LX, y + 4, LINE)
+    y += 14
 
+    draw.text((LX, y), "messages", font=f9b, fill=MUTED)
+    y += 13
+
+    for i in range(0, n_mails, 2):
+        ry = y + 24 * i
+        draw.rectangle([0, ry - 1, ILI_W, ry + 22], fill=SURFACE)
+    return img
+
+def _wrap(text, width, max_lines):
+    """Greedy wrap on whitespace, stopping once max_lines are full. One pass
+    over text.split() with a running length; a word longer than width gets a
+    line to itself. Runs of whitespace collapse to one space."""
+    out, buf, used = [], [], -1
+    for w in text.split():
+        if buf and used + 1 + len(w) > width:
+            out.append(" ".join(buf))
+            if len(out) == max_lines:
+                return out
+            buf, used = [], -1
+        buf.append(w)
+        used += 1 + len(w)
+    if buf:
+        out.append(" ".join(buf))
+    return out
+
+def render_emails(data: dict, img=None) -> Image.Image:
     time_str = data.get("time_str",     "00:00")
     summary  = data.get("summary",      "No summary.")
     emails   = data.get("emails",       [])
     unread   = data.get("unread_count",  0)
 
-    top_bar(draw, f"inbox  ·  {unread} unread", time_str, ORANGE)
+    # Greedy 38-char wrap on whitespace only, capped at the 5 lines that fit
+    # above the message list. (multiline_text isn't used: Pillow still shapes
+    # it line by line, plus an extra measuring pass.)
+    lines = _wrap(summary, 38, 5)
 
-    y  = BAR_H + 10
-    LX = 14
+    mails = (emails or DEFAULT_EMAILS)[:5]
 
-    draw.text((LX, y), "summary", font=fnt(9, bold=True), fill=MUTED)
-    y += 13
+    img  = from_base(_emails_base, img, len(lines), len(mails))
+    draw = ImageDraw.Draw(img)
+    f9, f9b, f10 = fnt(9), fnt(9, True), fnt(10)
 
-    words, line = summary.split(), ""
-    for word in words:
-        if len(line) + len(word) + 1 <= 38:
-            line += (" " if line else "") + word
-        else:
-            draw.text((LX, y), line, font=fnt(10), fill=WHITE)
-            y += 13
-            line = word
-        if y > BAR_H + 70:
-            break
-    if line:
-        draw.text((LX, y), line, font=fnt(10), fill=WHITE)
-        y += 13
+    top_bar_text(draw, f"inbox  ·  {unread} unread", time_str, ORANGE)
 
-    hline(draw, LX, ILI_W - LX, y + 4, LINE)
-    y += 14
+    LX = EMAIL_LX
+    y  = BAR_H + 10 + 13
 
-    draw.text((LX, y), "messages", font=fnt(9, bold=True), fill=MUTED)
-    y += 13
+    for line in lines:
+        draw.text((LX, y), line, font=f10, fill=WHITE)
+        y += 13
 
-    default_emails = [
-        {"from": "boss@work.com",  "subject": "Q4 review",    "time": "08:14"},
-        {"from": "noreply@gh.com", "subject": "PR merged",    "time": "09:02"},
-        {"from": "team@corp.com",  "subject": "Daily digest", "time": "09:30"},
-        {"from": "alerts@sys.io",  "subject": "Disk warning", "time": "10:01"},
-    ]
-    for i, mail in enumerate((emails or default_emails)[:5]):
-        if i % 2 == 0:
-            draw.rectangle([0, y - 1, ILI_W, y + 22], fill=SURFACE)
+    y += 14 + 13                       # divider + "messages" label (in base)
+
+    for mail in mails:
         dot(draw, LX + 2, y + 6, r=3, color=BLUE)
         draw.text((LX + 10, y),
-                  mail.get("from", ""), font=fnt(9, bold=True), fill=CYAN)
-        t_w = tw(draw, mail.get("time", ""), fnt(9))
+                  mail.get("from", ""), font=f9b, fill=CYAN)
+        t_w = tw(draw, mail.get("time", ""), f9)
         draw.text((ILI_W - t_w - 10, y),
-                  mail.get("time", ""), font=fnt(9), fill=MUTED)
+                  mail.get("time", ""), font=f9, fill=MUTED)
         draw.text((LX + 10, y + 11),
-                  mail.get("subject", ""), font=fnt(9), fill=WHITE)
+                  mail.get("subject", ""), font=f9, fill=WHITE)
         y += 24
 
     bottom_hint(draw, "← back")
@@ -402,83 +535,103 @@ def render_emails(data: dict) -> Image.Image:
 # SYSTEM CARE
 # ════════════════════════════════════════════════════════════════════════════════
 
-def render_sysmon(data: dict) -> Image.Image:
+SYS_LX    = 14
+SYS_MID   = ILI_W // 2
+SYS_BAR_W = 68
+SYS_PB_H  = 4
+SYS_Y     = BAR_H + 10
+# Column x, header, and (label, bar colour) per row — fixed; only values move
+SYS_COLS  = (
+    (SYS_LX,           "deck",   (("cpu", CYAN), ("ram", BLUE),
+                                  ("disk", GREEN), ("fan", YELLOW))),
+    (SYS_MID + SYS_LX, "server", (("cpu", CYAN), ("gpu", MAGENTA),
+                                  ("ram", BLUE), ("disk", GREEN))),
+)
+SYS_BOT   = SYS_Y + 16 + 4 * 24        # just below the last stat row
+
+def _sysmon_base():
     img  = ili_canvas()
     draw = ImageDraw.Draw(img)
+    f9, f10b = fnt(9), fnt(10, True)
+
+    top_bar(draw, "system care", accent=GREEN)
+
+    for x, label, rows in SYS_COLS:
+        draw.text((x, SYS_Y), label, font=f10b, fill=WHITE)
+        status_dot(draw, x + tw(draw, label, f10b) + 8, SYS_Y + 6)
+        y2 = SYS_Y + 16
+        for s_label, color in rows:
+            draw.text((x, y2), s_label, font=f9, fill=MUTED)
+            progress_bar(draw, x, y2 + 12, SYS_BAR_W, SYS_PB_H, 0, color)
+            y2 += 24
+    vline(draw, SYS_MID, BAR_H + 6, SYS_BOT + 4, LINE)
+    hline(draw, SYS_LX, ILI_W - SYS_LX, SYS_BOT + 10, LINE)
+
+    bottom_hint(draw, "← back")
+    return img
+
+def render_sysmon(data: dict, img=None) -> Image.Image:
+    img  = from_base(_sysmon_base, img)
+    draw = ImageDraw.Draw(img)
+    f9b, f10, f10b = fnt(9, True), fnt(10), fnt(10, True)
 
     time_str   = data.get("time_str",   "00:00")
-    deck       = data.get("deck",   {"cpu":40,"ram":28,"disk_used":40,"disk_total":64,"fan":35})
-    server     = data.get("server", {"cpu":40,"gpu":0, "ram":80,"disk_used":256,"disk_total":500})
-    temp_info  = data.get("temp_files", {"count":0, "size_mb":0})
+    # `or`, not a .get() default: the main loop sends None for stats it
+    # hasn't received yet
+    deck       = data.get("deck")       or {"cpu":40,"ram":28,"disk_used":40,"disk_total":64,"fan":35}
+    server     = data.get("server")     or {"cpu":40,"gpu":0, "ram":80,"disk_used":256,"disk_total":500}
+    temp_info  = data.get("temp_files") or {"count":0, "size_mb":0}
     clean_done = data.get("clean_done", False)
 
-    top_bar(draw, "system care", time_str, GREEN)
-
-    LX    = 14
-    MID   = ILI_W // 2
-    BAR_W = 68
-    PB_H  = 4
-    y     = BAR_H + 10
-
-    def stat_col(x, label, online, stats, y_start):
-        draw.text((x, y_start), label, font=fnt(10, bold=True), fill=WHITE)
-        status_dot(draw,
-                   x + tw(draw, label, fnt(10, True)) + 8,
-                   y_start + 6, online=online)
-        y2 = y_start + 16
-        for s_label, frac, value, color in stats:
-            draw.text((x,      y2), s_label, font=fnt(9),            fill=MUTED)
-            draw.text((x + 30, y2), value,   font=fnt(9, bold=True), fill=WHITE)
-            progress_bar(draw, x, y2 + 12, BAR_W, PB_H, frac, color)
+    top_bar_text(draw, right_text=time_str, accent=GREEN)
+
+    def stat_col(x, rows, stats):
+        y2 = SYS_Y + 16
+        for (_, color), (frac, value) in zip(rows, stats):
+            draw.text((x + 30, y2), value, font=f9b, fill=WHITE)
+            progress_fill(draw, x, y2 + 12, SYS_BAR_W, SYS_PB_H, frac, color)
             y2 += 24
-        return y2
-
-    du, dt  = _safe(deck,   "disk_used", "DISK_USED",  "used",  default=0), \
-              _safe(deck,   "disk_total","DISK_TOTAL", "total", default=64)
-    su, st2 = _safe(server, "disk_used", "DISK_USED",  "used",  default=0), \
-              _safe(server, "disk_total","DISK_TOTAL", "total", default=500)
-
-    d_cpu = _safe(deck,   "cpu", "CPU", default=0)
-    d_ram = _safe(deck,   "ram", "RAM", "mem", default=0)
-    d_fan = _safe(deck,   "fan", "FAN", default=0)
-    s_cpu = _safe(server, "cpu", "CPU", default=0)
-    s_gpu = _safe(server, "gpu", "GPU", default=0)
-    s_ram = _safe(server, "ram", "RAM", "mem", default=0)
-
-    deck_stats = [
-        ("cpu",  d_cpu / 100, f"{d_cpu}%",   CYAN),
-        ("ram",  d_ram / 100, f"{d_ram}%",   BLUE),
-        ("disk", du / max(dt, 1),  f"{du}/{dt}G",  GREEN),
-        ("fan",  d_fan / 100, f"{d_fan}%",   YELLOW),
+
+    deck, server = _norm(deck), _norm(server)
+    du, dt  = deck.get("disk_used",   0), deck.get("disk_total",   64)
+    su, st2 = server.get("disk_used", 0), server.get("disk_total", 500)
+
+    d_cpu = deck.get("cpu",   0)
+    d_ram = deck.get("ram",   0)
+    d_fan = deck.get("fan",   0)
+    s_cpu = server.get("cpu", 0)
+    s_gpu = server.get("gpu", 0)
+    s_ram = server.get("ram", 0)
+
+    deck_stats = [                     # same order as SYS_COLS rows
+        (d_cpu / 100,      f"{d_cpu}%"),
+        (d_ram / 100,      f"{d_ram}%"),
+        (du / max(dt, 1),  f"{du}/{dt}G"),
+        (d_fan / 100,      f"{d_fan}%"),
     ]
     server_stats = [
-        ("cpu",  s_cpu / 100, f"{s_cpu}%",   CYAN),
-        ("gpu",  s_gpu / 100, f"{s_gpu}%",   MAGENTA),
-        ("ram",  s_ram / 100, f"{s_ram}%",   BLUE),
-        ("disk", su / max(st2, 1), f"{su}/{st2}G", GREEN),
+        (s_cpu / 100,      f"{s_cpu}%"),
+        (s_gpu / 100,      f"{s_gpu}%"),
+        (s_ram / 100,      f"{s_ram}%"),
+        (su / max(st2, 1), f"{su}/{st2}G"),
     ]
 
-    by1 = stat_col(LX,       "deck",   True, deck_stats,   y)
-    by2 = stat_col(MID + LX, "server", True, server_stats, y)
-    vline(draw, MID, BAR_H + 6, max(by1, by2) + 4, LINE)
-
-    cy = max(by1, by2) + 10
-    hline(draw, LX, ILI_W - LX, cy, LINE)
-    cy += 8
+    for (x, _, rows), stats in zip(SYS_COLS, (deck_stats, server_stats)):
+        stat_col(x, rows, stats)
 
+    LX = SYS_LX
+    cy = SYS_BOT + 18                  # below the divider in the base
     cnt = temp_info.get("count",   0)
     mb  = temp_info.get("size_mb", 0)
     draw.text((LX, cy),
               f"temp:  {cnt} files  /  {mb} MB",
-              font=fnt(10), fill=MUTED)
+              font=f10, fill=MUTED)
     cy += 16
 
     if clean_done:
-        draw.text((LX, cy), "✓  cleaned", font=fnt(10, bold=True), fill=GREEN)
+        draw.text((LX, cy), "✓  cleaned", font=f10b, fill=GREEN)
     else:
-        draw.text((LX, cy), "tap to clean", font=fnt(10), fill=YELLOW)
-
-    bottom_hint(draw, "← back")
+        draw.text((LX, cy), "tap to clean", font=f10, fill=YELLOW)
     return img
 
 
@@ -486,9 +639,19 @@ def render_sysmon(data: dict) -> Image.Image:
 # FOCUS MODE
 # ════════════════════════════════════════════════════════════════════════════════
 
-def render_focus(data: dict) -> Image.Image:
+FOCUS_LX = 30
+FOCUS_PB = ILI_W - FOCUS_LX * 2              # progress bar width
+
+def _focus_base(pb_y):
+    """Top bar and the empty progress trough, which sits under the timer."""
     img  = ili_canvas()
     draw = ImageDraw.Draw(img)
+    top_bar(draw, "focus", accent=MAGENTA)
+    progress_bar(draw, FOCUS_LX, pb_y, FOCUS_PB, 5, 0, MAGENTA)
+    return img
+
+def render_focus(data: dict, img=None) -> Image.Image:
+    f9, f11, f11b = fnt(9), fnt(11), fnt(11, True)
 
     time_str     = data.get("time_str",     "00:00")
     session_mins = data.get("session_mins", 25)
@@ -497,24 +660,27 @@ def render_focus(data: dict) -> Image.Image:
     active       = data.get("active",       False)
     message      = data.get("message",      "")
 
-    top_bar(draw, "focus", time_str, MAGENTA)
-
     frac      = elapsed_mins / max(1, session_mins)
     remaining = max(0, session_mins - elapsed_mins)
-    LX        = 30
+    LX        = FOCUS_LX
 
     # ── Timer — sits comfortably below top bar ────────────────────────────────
     timer_str = f"{remaining:02d}:00"
     tf  = fnt(54, bold=True)
-    t_w = tw(draw, timer_str, tf)
-    t_h = th(draw, timer_str, tf)
+    t_w = tw(None, timer_str, tf)
+    t_h = th(None, timer_str, tf)
     timer_y = BAR_H + 22
-    draw.text(((ILI_W - t_w) // 2, timer_y),
-              timer_str, font=tf, fill=WHITE)
 
-    # ── Progress bar — 18px below timer ──────────────────────────────────────
+    # ── Progress bar — 18px below timer; its trough is in the base ────────────
     pb_y = timer_y + t_h + 18
-    progress_bar(draw, LX, pb_y, ILI_W - LX * 2, 5, frac, MAGENTA)
+
+    img  = from_base(_focus_base, img, pb_y)
+    draw = ImageDraw.Draw(img)
+
+    top_bar_text(draw, right_text=time_str, accent=MAGENTA)
+    draw.text(((ILI_W - t_w) // 2, timer_y),
+              timer_str, font=tf, fill=WHITE)
+    progress_fill(draw, LX, pb_y, FOCUS_PB, 5, frac, MAGENTA)
 
     # ── Status row — 22px below bar ───────────────────────────────────────────
     my      = pb_y + 26
@@ -522,24 +688,24 @@ def render_focus(data: dict) -> Image.Image:
     status_dot(draw, LX, my + 5, online=active)
     draw.text((LX + 12, my),
               "active" if active else "idle",
-              font=fnt(11), fill=s_color)
+              font=f11, fill=s_color)
 
     if app_name:
-        a_w = tw(draw, app_name, fnt(11, bold=True))
+        a_w = tw(draw, app_name, f11b)
         draw.text((ILI_W - a_w - LX, my),
-                  app_name, font=fnt(11, bold=True), fill=CYAN)
+                  app_name, font=f11b, fill=CYAN)
 
     # ── Notes — 20px below status ─────────────────────────────────────────────
     ny = my + 26
     if active:
         draw.text((LX, ny),
                   "windows closed  ·  notifications off",
-                  font=fnt(9), fill=MUTED)
+                  font=f9, fill=MUTED)
         ny += 18
 
     # ── Optional message ──────────────────────────────────────────────────────
     if message and ny + 10 < ILI_H - BOT_H:
-        draw.text((LX, ny), message, font=fnt(9), fill=YELLOW)
+        draw.text((LX, ny), message, font=f9, fill=YELLOW)
 
     bottom_hint(draw, "← back / end session")
     return img
@@ -549,85 +715,96 @@ def render_focus(data: dict) -> Image.Image:
 # ST7735  –  STATUS WIDGET
 # ════════════════════════════════════════════════════════════════════════════════
 
-def render_st_status(data: dict) -> Image.Image:
+ST_HW    = ST_W // 2    # 80  — column midpoint
+ST_TOP_H = 86           # stats occupy top 86px, weather gets 42px
+ST_WY    = ST_TOP_H + 3
+# Column x and (label, dot colour) per stat row — only the values are live
+ST_ROWS  = (
+    (2,         (("CPU", CYAN), ("FAN", YELLOW),  ("DISK", GREEN))),
+    (ST_HW + 2, (("CPU", CYAN), ("GPU", MAGENTA), ("DISK", GREEN))),
+)
+
+def _st_base():
+    img  = st_canvas()
+    draw = ImageDraw.Draw(img)
+    f8b, f9b = fnt(8, True), fnt(9, True)
+
+    # ── Structure lines ───────────────────────────────────────────────────────
+    vline(draw, ST_HW, 0,    ST_TOP_H, LINE)
+    hline(draw, 0,     ST_W, ST_TOP_H, LINE)
+
+    # ── DECK / SERVER headers (status dots are live) ──────────────────────────
+    draw.text((4, 2), "DECK", font=f9b, fill=CYAN)
+    hline(draw, 2, ST_HW - 2, 15, LINE)
+    draw.text((ST_HW + 4, 2), "SERVER", font=f9b, fill=CYAN)
+    hline(draw, ST_HW + 2, ST_W - 2, 15, LINE)
+
+    # ── Stat rows: colour dot + label ─────────────────────────────────────────
+    for x, rows in ST_ROWS:
+        y = 18
+        for label, color in rows:
+            dot(draw, x + 3, y + 5, r=3, color=color)
+            draw.text((x + 10, y), label, font=f9b, fill=MUTED)
+            y += 24
+
+    # ── WEATHER header ────────────────────────────────────────────────────────
+    draw.text((4, ST_WY), "weather", font=f8b, fill=MUTED)
+    hline(draw, 2, ST_W - 2, ST_WY + 14, LINE)
+    return img
+
+def render_st_status(data: dict, img=None) -> Image.Image:
     """
     ST7735 160×128 landscape — larger, clearer elements.
     Top 2/3: DECK (left) | SERVER (right)
     Bottom 1/3: weather full width
     """
-    img  = st_canvas()
+    img  = from_base(_st_base, img)
     draw = ImageDraw.Draw(img)
+    f10b, f16b, f18 = fnt(10, True), fnt(16, True), fnt(18)
 
-    deck          = data.get("deck",   {})
-    server        = data.get("server", {})
-    weather       = data.get("weather", {})
+    deck          = data.get("deck")    or {}
+    server        = data.get("server")  or {}
+    weather       = data.get("weather") or {}
     deck_online   = data.get("deck_online",   True)
     server_online = data.get("server_online", True)
 
-    d_cpu  = _safe(deck,   "cpu",  "CPU",  default=0)
-    d_fan  = _safe(deck,   "fan",  "FAN",  default=0)
-    d_ram  = _safe(deck,   "ram",  "RAM",  "mem", default=0)
-    d_du   = _safe(deck,   "disk_used",  "DISK_USED",  "used",  default=0)
-    d_dt   = _safe(deck,   "disk_total", "DISK_TOTAL", "total", default=64)
+    deck, server = _norm(deck), _norm(server)
+    d_cpu  = deck.get("cpu",          0)
+    d_fan  = deck.get("fan",          0)
+    d_du   = deck.get("disk_used",    0)
+    d_dt   = deck.get("disk_total",   64)
 
-    s_cpu  = _safe(server, "cpu",  "CPU",  default=0)
-    s_gpu  = _safe(server, "gpu",  "GPU",  default=0)
-    s_ram  = _safe(server, "ram",  "RAM",  "mem", default=0)
-    s_du   = _safe(server, "disk_used",  "DISK_USED",  "used",  default=0)
-    s_dt   = _safe(server, "disk_total", "DISK_TOTAL", "total", default=500)
+    s_cpu  = server.get("cpu",        0)
+    s_gpu  = server.get("gpu",        0)
+    s_du   = server.get("disk_used",  0)
+    s_dt   = server.get("disk_total", 500)
 
     w_icon   = _safe(weather, "icon",    "Icon",   default="~")
     w_hi     = _safe(weather, "temp_hi", "high",   "hi",  default="--")
     w_lo     = _safe(weather, "temp_lo", "low",    "lo",  default="--")
     w_online = _safe(weather, "online",  "Online", default=True)
 
-    HW    = ST_W // 2    # 80  — column midpoint
-    TOP_H = 86           # stats occupy top 86px, weather gets 42px
+    # ── Header status dots ────────────────────────────────────────────────────
+    status_dot(draw, ST_HW - 8, 7, online=deck_online)
+    status_dot(draw, ST_W - 6,  7, online=server_online)
 
-    # ── Structure lines ───────────────────────────────────────────────────────
-    vline(draw, HW,   0,    TOP_H, LINE)
-    hline(draw, 0,    ST_W, TOP_H, LINE)
-
-    # ── DECK header ───────────────────────────────────────────────────────────
-    draw.text((4, 2), "DECK", font=fnt(9, bold=True), fill=CYAN)
-    status_dot(draw, HW - 8, 7, online=deck_online)
-    hline(draw, 2, HW - 2, 15, LINE)
-
-    # ── SERVER header ─────────────────────────────────────────────────────────
-    draw.text((HW + 4, 2), "SERVER", font=fnt(9, bold=True), fill=CYAN)
-    status_dot(draw, ST_W - 6, 7, online=server_online)
-    hline(draw, HW + 2, ST_W - 2, 15, LINE)
-
-    # ── Stat rows ─────────────────────────────────────────────────────────────
-    def stat_row(x, y, label, value, color):
-        """One stat: colour dot + label + value on same line."""
-        dot(draw, x + 3, y + 5, r=3, color=color)
-        draw.text((x + 10, y), label,
-                  font=fnt(9, bold=True), fill=MUTED)
-        draw.text((x + 10, y + 11), value,
-                  font=fnt(10, bold=True), fill=WHITE)
-        return y + 24
-
-    sy = 18
-    sy = stat_row(2,       sy, "CPU",  f"{d_cpu}°C",       CYAN)
-    sy = stat_row(2,       sy, "FAN",  f"{d_fan}%",        YELLOW)
-    sy = stat_row(2,       sy, "DISK", f"{d_du}/{d_dt}G",  GREEN)
-
-    sy = 18
-    sy = stat_row(HW + 2,  sy, "CPU",  f"{s_cpu}°C",       CYAN)
-    sy = stat_row(HW + 2,  sy, "GPU",  f"{s_gpu}%",        MAGENTA)
-    sy = stat_row(HW + 2,  sy, "DISK", f"{s_du}/{s_dt}G",  GREEN)
+    # ── Stat values (same order as ST_ROWS) ───────────────────────────────────
+    values = ((f"{d_cpu}°C", f"{d_fan}%", f"{d_du}/{d_dt}G"),
+              (f"{s_cpu}°C", f"{s_gpu}%", f"{s_du}/{s_dt}G"))
+    for (x, _), col in zip(ST_ROWS, values):
+        y = 18
+        for value in col:
+            draw.text((x + 10, y + 11), value, font=f10b, fill=WHITE)
+            y += 24
 
     # ── WEATHER panel ─────────────────────────────────────────────────────────
-    wy = TOP_H + 3
-    draw.text((4, wy), "weather", font=fnt(8, bold=True), fill=MUTED)
+    wy = ST_WY
     status_dot(draw, ST_W - 6, wy + 5, online=w_online)
-    hline(draw, 2, ST_W - 2, wy + 14, LINE)
 
     draw.text((5,  wy + 16), str(w_icon),
-              font=fnt(18), fill=WHITE)
+              font=f18, fill=WHITE)
     draw.text((30, wy + 17), f"{w_hi}\u00b0/{w_lo}\u00b0 C",
-              font=fnt(16, bold=True), fill=WHITE)
+              font=f16b, fill=WHITE)
 
     return img
 